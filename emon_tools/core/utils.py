@@ -1,4 +1,5 @@
 """Fina Utils Module"""
+from functools import lru_cache
 from typing import Any, Optional
 from typing import Tuple
 from typing import Union
@@ -317,7 +318,21 @@ class Utils:
         """
         if not isinstance(dt_value, str):
             raise TypeError("The input date-time value must be a string.")
+        return Utils._parse_datetime_string(dt_value, date_format, timezone)
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_datetime_string(
+        dt_value: str,
+        date_format: str,
+        timezone: Optional[dt.timezone]
+    ) -> dt.datetime:
+        """
+        Parse a date string with strptime.
+
+        Results are cached, datetime objects being immutable.
+        Invalid values raise and are never cached.
+        """
         try:
             naive_datetime = dt.datetime.strptime(dt_value, date_format)
             if isinstance(timezone, dt.timezone):
@@ -360,7 +375,22 @@ class Utils:
             raise ValueError("'start' and 'window' must be integers.")
         if start < 0 or window < 0:
             raise ValueError("'start' and 'window' must be non-negative.")
+        return Utils._format_dates_interval(
+            start, window, date_format, timezone)
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _format_dates_interval(
+        start: int,
+        window: int,
+        date_format: str,
+        timezone: Optional[dt.timezone]
+    ) -> Tuple[str, str]:
+        """
+        Format start and end dates of a validated interval.
+
+        Results are cached, the same intervals being formatted repeatedly.
+        """
         if isinstance(timezone, dt.timezone):
             start_dt = dt.datetime.fromtimestamp(start, tz=dt.timezone.utc)
         else:
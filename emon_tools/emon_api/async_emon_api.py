@@ -37,6 +37,7 @@ from aiohttp import ClientError, ClientSession
 from emon_tools.emon_api.api_utils import HTTP_STATUS
 from emon_tools.emon_api.api_utils import MESSAGE_KEY
 from emon_tools.emon_api.api_utils import SUCCESS_KEY
+from emon_tools.emon_api.circuit_breaker import CircuitBreaker
 from emon_tools.emon_api.emon_api_core import InputGetType
 from emon_tools.emon_api.emon_api_core import RequestType
 from emon_tools.emon_api.emon_api_core import EmonRequestCore
@@ -65,10 +66,14 @@ class AsyncEmonRequest:
             The API key for authenticating with the Emoncms server.
         request_timeout (int):
             Timeout for HTTP requests in seconds (default: 20).
+        circuit_breaker (CircuitBreaker):
+            Stops requests to the server after consecutive
+            connection failures (default: 5 failures, 30s recovery).
     """
     url: str
     api_key: str
     request_timeout: int = 20
+    circuit_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
     _session: Optional[ClientSession] = field(default=None, init=False)
     _close_session: bool = field(default=False, init=False)
     logger = logging.getLogger(__name__)
@@ -140,6 +145,9 @@ class AsyncEmonRequest:
 
         Returns:
             Dict[str, Any]: A dictionary containing the response data.
+                While the circuit breaker is open, the request is not sent
+                and the message is "Circuit open: {msg}.",
+                or "Circuit open." without msg.
 
         Raises:
             ValueError: If the path is invalid or empty.
@@ -169,6 +177,12 @@ class AsyncEmonRequest:
             'content-type': 'application/x-www-form-urlencoded',
             'charset': 'UTF-8'
         }
+        if not self.circuit_breaker.allow_request():
+            error_msg = f"Circuit open: {msg}." if msg else "Circuit open."
+            result[MESSAGE_KEY] = error_msg
+            self.logger.error(error_msg)
+            return result
+
         try:
             if request_type == RequestType.GET:
                 async with self.session.get(
@@ -196,14 +210,17 @@ class AsyncEmonRequest:
                         response=response,
                         msg=msg
                     )
+            self.circuit_breaker.record_success()
         except ClientError as err:
             error_msg = f"Client error: {msg} - {err}"
             result[MESSAGE_KEY] = error_msg
             self.logger.error(error_msg)
+            self.circuit_breaker.record_failure()
         except asyncio.TimeoutError:
             error_msg = f"Request timeout: {msg}."
             result[MESSAGE_KEY] = error_msg
             self.logger.error(error_msg)
+            self.circuit_breaker.record_failure()
 
         return result
 
@@ -0,0 +1,83 @@
+"""
+Circuit breaker for Emoncms api requests.
+
+Stops issuing requests to an unreachable Emoncms server
+after a number of consecutive connection failures,
+and lets a single trial request through once the recovery timeout elapsed.
+
+Only transport failures (client errors, timeouts) must be recorded.
+HTTP error responses, such as authentication failures,
+never open the circuit.
+"""
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """Circuit Breaker State Enum"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Closed -> Open -> Half Open circuit breaker state machine.
+
+    Attributes:
+        failure_threshold (int):
+            Number of consecutive failures opening the circuit (default: 5).
+        recovery_timeout (float):
+            Time in seconds before allowing a trial request (default: 30).
+    """
+    failure_threshold: int = 5
+    recovery_timeout: float = 30
+    state: CircuitState = field(default=CircuitState.CLOSED, init=False)
+    _failures: int = field(default=0, init=False)
+    _opened_at: float = field(default=0.0, init=False)
+    _trial_in_flight: bool = field(default=False, init=False)
+    _trial_at: float = field(default=0.0, init=False)
+
+    def allow_request(self) -> bool:
+        """
+        Check if a request can be sent.
+
+        Move an open circuit to half open
+        once the recovery timeout has elapsed,
+        and let a single trial request through.
+        Other requests are rejected until the trial is recorded,
+        or until a trial never recorded is older than the recovery timeout.
+
+        Returns:
+            bool: True if the request can be sent, otherwise False.
+        """
+        if self.state == CircuitState.CLOSED:
+            return True
+        now = time.monotonic()
+        if self._trial_in_flight:
+            if now - self._trial_at < self.recovery_timeout:
+                return False
+        elif now - self._opened_at < self.recovery_timeout:
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self._trial_in_flight = True
+        self._trial_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failures counter."""
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit if needed."""
+        self._failures += 1
+        self._trial_in_flight = False
+        is_open = self.state == CircuitState.HALF_OPEN\
+            or self._failures >= self.failure_threshold
+        if is_open:
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
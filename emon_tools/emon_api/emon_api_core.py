@@ -27,7 +27,9 @@ Security and validation:
 - The API key is validated to ensure it is alphanumeric and secure.
 """
 from enum import Enum
+from functools import lru_cache
 import logging
+import re
 from typing import Any, Optional, Dict, Union
 from urllib.parse import quote_plus, urljoin
 import simplejson as sj
@@ -35,8 +37,34 @@ from emon_tools.emon_api.api_utils import Utils as Ut
 from emon_tools.emon_api.api_utils import MESSAGE_KEY
 from emon_tools.emon_api.api_utils import SUCCESS_KEY
 
+try:
+    import orjson
+    # Pass values simplejson can not serialize to a failing default.
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS\
+        | orjson.OPT_PASSTHROUGH_DATETIME\
+        | orjson.OPT_PASSTHROUGH_DATACLASS\
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+except ImportError:  # pragma: no cover
+    orjson = None
+    ORJSON_OPTIONS = 0
+
 logging.basicConfig()
 
+# Url path characters changed by quote_plus(path, safe="/").
+UNSAFE_PATH_PATTERN = re.compile(r"[^A-Za-z0-9_.~/-]")
+# Compact JSON separators, matching orjson output.
+JSON_SEPARATORS = (",", ":")
+# Dict key types serialized alike by orjson and simplejson.
+JSON_KEY_TYPES = (str, int)
+# Integers range serialized by orjson.
+ORJSON_INT_RANGE = range(-2**63, 2**64)
+# Floats range written without exponent by both orjson and simplejson.
+PLAIN_FLOAT_MIN = 1e-4
+PLAIN_FLOAT_MAX = 1e16
+# Emoncms inputs and feeds fields returned as strings but holding integers.
+INT_FIELDS = frozenset(
+    ('id', 'userid', 'public', 'size', 'engine', 'interval'))
+
 
 class RequestType(Enum):
     """Request Type Method Enum"""
@@ -45,11 +73,18 @@ class RequestType(Enum):
 
 
 class InputGetType(Enum):
-    """Remove Nan Method Enum"""
+    """Inputs Fields Get Type Enum"""
     PROCESS_LIST = "process_list"
     EXTENDED = "extended"
 
 
+# Emoncms inputs fields list path by InputGetType.
+INPUTS_FIELDS_PATHS = {
+    InputGetType.PROCESS_LIST: "/input/getinputs",
+    InputGetType.EXTENDED: "/input/list",
+}
+
+
 class EmonEngines(Enum):
     """EmonCms Available Engines Method Enum"""
     MYSQL = 0  # Deprecated
@@ -186,6 +221,17 @@ class EmonApiCore:
         """
         if not Ut.is_str(url, not_empty=True):
             raise TypeError("URL must be a non-empty string.")
+        return EmonApiCore._sanitize_url(url)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _sanitize_url(url: str) -> str:
+        """
+        Check the URL scheme and sanitize it.
+
+        Results are cached, the same URL being validated on each request.
+        Invalid URLs raise and are never cached.
+        """
         if not (url.startswith("http://") or url.startswith("https://")):
             raise ValueError("URL must start with 'http://' or 'https://'.")
         return url.rstrip("/")  # Remove trailing slash for consistency.
@@ -204,7 +250,21 @@ class EmonApiCore:
         Raises:
             ValueError: If the API key is not a non-empty alphanumeric string.
         """
-        if not isinstance(api_key, str) or not api_key.isalnum():
+        if not isinstance(api_key, str):
+            raise ValueError(
+                "API key must be a non-empty alphanumeric string."
+            )
+        return EmonApiCore._check_api_key(api_key)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _check_api_key(api_key: str) -> str:
+        """
+        Check the API key is alphanumeric.
+
+        Results are cached, invalid keys raise and are never cached.
+        """
+        if not api_key.isalnum():
             raise ValueError(
                 "API key must be a non-empty alphanumeric string."
             )
@@ -219,19 +279,97 @@ class EmonApiCore:
         """
         result = []
         if Ut.is_list(data, not_empty=True):
-            for item in data:
-                int_keys = [
-                    'id', 'userid', 'public', 'size', 'engine', 'interval']
-                tmp = item.copy()
-                for k, v in item.items():
-                    if k in int_keys:
-                        tmp[k] = Ut.str_to_int(v, 0)
-                result.append(tmp)
+            result = [
+                {
+                    k: Ut.str_to_int(v, 0) if k in INT_FIELDS else v
+                    for k, v in item.items()
+                }
+                for item in data
+            ]
         return result
 
 
 class EmonRequestCore:
     """EmonRequest common helper"""
+    @staticmethod
+    def _reject_json_default(value: Any) -> Any:
+        """orjson default, rejecting values simplejson can not serialize."""
+        raise TypeError(
+            f"Object of type {type(value).__name__} "
+            "is not JSON serializable")
+
+    @staticmethod
+    def _is_plain_json(value: Any) -> bool:
+        """
+        Check a value only holds plain JSON types,
+        serialized alike by orjson and simplejson.
+
+        NaN and infinite floats, floats written with an exponent,
+        integers out of orjson range, non str or int keys,
+        and any other type (Decimal, datetime, Enum, subclasses...)
+        are not plain JSON.
+
+        Args:
+            value (Any): The value to check.
+
+        Returns:
+            bool: True if value only holds plain JSON types.
+        """
+        value_type = type(value)
+        if value_type is str or value_type is bool or value is None:
+            return True
+        if value_type is int:
+            return value in ORJSON_INT_RANGE
+        if value_type is float:
+            # False for NaN and infinite floats.
+            return value == 0\
+                or PLAIN_FLOAT_MIN <= abs(value) < PLAIN_FLOAT_MAX
+        if value_type is list or value_type is tuple:
+            return all(map(EmonRequestCore._is_plain_json, value))
+        if value_type is dict:
+            return all(
+                type(key) in JSON_KEY_TYPES
+                and EmonRequestCore._is_plain_json(key)
+                and EmonRequestCore._is_plain_json(item)
+                for key, item in value.items()
+            )
+        return False
+
+    @staticmethod
+    def dumps_json(value: Any) -> str:
+        """
+        Serialize a value to a compact JSON string.
+
+        Plain JSON values are serialized with orjson when installed,
+        any other value with simplejson,
+        so output and errors do not depend on orjson being installed.
+
+        Args:
+            value (Any): The value to serialize.
+
+        Returns:
+            str: JSON string.
+
+        Raises:
+            ValueError: If value holds NaN or infinite floats.
+            TypeError: If value holds not JSON serializable objects.
+        """
+        if orjson is not None and EmonRequestCore._is_plain_json(value):
+            try:
+                return orjson.dumps(
+                    value,
+                    default=EmonRequestCore._reject_json_default,
+                    option=ORJSON_OPTIONS
+                ).decode()
+            except TypeError:
+                pass
+        return sj.dumps(
+            value,
+            separators=JSON_SEPARATORS,
+            ensure_ascii=False,
+            allow_nan=False
+        )
+
     @staticmethod
     def compute_response(
         response: Union[dict, list, str, None]
@@ -282,8 +420,10 @@ class EmonRequestCore:
                 "Url Path must be a non-empty string."
                 )
 
+        path = path.lstrip('/')
         # Encode unsafe characters in the path.
-        path = quote_plus(path.lstrip('/'), safe="/")
+        if UNSAFE_PATH_PATTERN.search(path) is not None:
+            path = quote_plus(path, safe="/")
         # Safely join the base URL and path.
         return urljoin(url, path)
 
@@ -295,8 +435,8 @@ class EmonRequestCore:
         """Encode request params"""
         encoded_params = {}
 
-        if not Ut.is_list(unquote_keys):
-            unquote_keys = []
+        unquote_keys = frozenset(unquote_keys)\
+            if Ut.is_list(unquote_keys) else frozenset()
 
         if Ut.is_dict(params, not_empty=True):
             for key, value in params.items():
@@ -305,7 +445,7 @@ class EmonRequestCore:
                 if is_not_object:
                     encoded_params[key] = quote_plus(str(value), safe="-")
                 elif isinstance(value, (list, dict)):
-                    encoded_params[key] = sj.dumps(value)
+                    encoded_params[key] = EmonRequestCore.dumps_json(value)
                 else:
                     encoded_params[key] = value
         return encoded_params
@@ -351,10 +491,8 @@ class EmonInputsCore:
             Optional[List[Dict[str, Any]]]: A list of input dictionaries
             or None if retrieval fails.
         """
-        if get_type == InputGetType.PROCESS_LIST:
-            path = "/input/getinputs"
-        else:
-            path = "/input/list"
+        path = INPUTS_FIELDS_PATHS.get(
+            get_type, INPUTS_FIELDS_PATHS[InputGetType.EXTENDED])
         return path, None
 
     @staticmethod
@@ -478,7 +616,7 @@ class EmonInputsCore:
                 "from (timestamp, sentat or offset)."
                 )
         data = {
-            "data": sj.dumps(data)
+            "data": EmonRequestCore.dumps_json(data)
         }
 
         return "/input/bulk", params, data
@@ -687,8 +825,24 @@ class EmonFeedsCore:
         Add data points to feed id.
         On error return a dict as:
         - {"success": false, "message": "Invalid fields"}
+
+        Data can also be a NumPy array of shape (N, 2),
+        converted to nested lists on whole columns,
+        integral times being cast to integers.
         """
         feed_id = Ut.validate_integer(feed_id, "Feed ID", positive=True)
+        if hasattr(data, "tolist"):
+            if data.ndim != 2 or data.shape[1] != 2:
+                raise ValueError(
+                    "Data points array must have a (N, 2) shape.")
+            times = data[:, 0]
+            if (times % 1 == 0).all():
+                data = list(map(list, zip(
+                    times.astype("int64").tolist(),
+                    data[:, 1].tolist()
+                )))
+            else:
+                data = data.tolist()
         for item in data:
             Ut.validate_time_series_data_point(item[0], item[1])
 
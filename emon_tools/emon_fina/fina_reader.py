@@ -4,7 +4,8 @@ Common utilities for Fina Files processing.
 from os.path import isdir, isfile, getsize
 from os.path import abspath, splitext
 from os.path import join as path_join
-from struct import unpack
+from struct import Struct
+from typing import Optional
 from typing import Tuple
 from typing import Generator
 import logging
@@ -39,6 +40,10 @@ class FinaReader:
     # 64 KB = 16384 bytes / 4 bytes = 4096 points
     CHUNK_SIZE_LIMIT = 4096
     VALID_FILE_EXTENSIONS = {".dat", ".meta"}
+    # Meta header: interval and start_time as little-endian uint32
+    META_STRUCT = Struct("<2I")
+    # Meta header offset, after the two legacy uint32 fields
+    META_OFFSET = 8
 
     def __init__(self, file_name: str, data_dir: str):
         """
@@ -57,6 +62,9 @@ class FinaReader:
         )
 
         self.props: FileReaderProps = None
+        # Sanitized meta and data file paths, resolved on first access
+        self._meta_path: Optional[str] = None
+        self._data_path: Optional[str] = None
 
     def _sanitize_path(self, filename: str) -> str:
         """
@@ -93,16 +101,20 @@ class FinaReader:
         )
 
     def _get_meta_path(self) -> str:
-        file_path = f"{self._get_base_path()}.meta"
-        file_path = self._sanitize_path(file_path)
+        if self._meta_path is None:
+            self._meta_path = self._sanitize_path(
+                f"{self._get_base_path()}.meta")
+        file_path = self._meta_path
         if not isfile(file_path):
             raise FileNotFoundError(f"Meta file does not exist: {file_path}")
         self._validate_file_size(file_path, self.MAX_META_SIZE)
         return file_path
 
     def _get_data_path(self) -> str:
-        file_path = f"{self._get_base_path()}.dat"
-        file_path = self._sanitize_path(file_path)
+        if self._data_path is None:
+            self._data_path = self._sanitize_path(
+                f"{self._get_base_path()}.dat")
+        file_path = self._data_path
         if not isfile(file_path):
             raise FileNotFoundError(f"Data file does not exist: {file_path}")
         self._validate_file_size(file_path, self.MAX_DATA_SIZE)
@@ -120,11 +132,12 @@ class FinaReader:
         """
         try:
             with open(self._get_meta_path(), "rb") as file:
-                file.seek(8)
-                hexa = file.read(8)
-                if len(hexa) != 8:
+                header_size = self.META_OFFSET + self.META_STRUCT.size
+                hexa = file.read(header_size)
+                if len(hexa) != header_size:
                     raise ValueError("Meta file is corrupted.")
-                interval, start_time = unpack("<2I", hexa)
+                interval, start_time = self.META_STRUCT.unpack_from(
+                    hexa, self.META_OFFSET)
 
             data_size = getsize(self._get_data_path())
             npoints = data_size // 4
@@ -226,11 +226,17 @@ class AsyncEmonPy(AsyncEmonFeeds):
                 structure=structure
             )
 
+            inputs_index, feeds_index = EmonPyCore.index_structure(
+                inputs=inputs,
+                feeds=feeds
+            )
             for item in structure:
                 inputs_on, feeds_on = EmonPyCore.get_existant_structure(
                     input_item=item,
                     inputs=inputs,
-                    feeds=feeds
+                    feeds=feeds,
+                    inputs_index=inputs_index,
+                    feeds_index=feeds_index
                 )
                 # is invalid current input
                 if not Ut.is_list(inputs_on)\
@@ -283,11 +289,17 @@ class AsyncEmonPy(AsyncEmonFeeds):
                 input_filter=filters.filter_inputs,
                 feed_filter=filters.filter_feeds
             )
+            inputs_index, feeds_index = EmonPyCore.index_structure(
+                inputs=inputs,
+                feeds=feeds
+            )
             for item in structure:
                 inputs_on, feeds_on = EmonPyCore.get_existant_structure(
                     input_item=item,
                     inputs=inputs,
-                    feeds=feeds
+                    feeds=feeds,
+                    inputs_index=inputs_index,
+                    feeds_index=feeds_index
                 )
                 if Ut.is_list(inputs_on) and len(inputs_on) == 1:
                     inputs_on = inputs_on[0]
@@ -5,6 +5,8 @@ The `emonpy_core` module contains helper classes and methods
 designed to sort, filter, arrange, and format EmonCMS Inputs and Feeds data.
 """
 import logging
+from operator import itemgetter
+import re
 from typing import Optional
 from typing import Union
 from emon_tools.emon_api.api_utils import MESSAGE_KEY
@@ -14,6 +16,20 @@ from emon_tools.emon_api.emon_api_core import EmonApiCore
 
 logging.basicConfig()
 
+# Comma-separated 'int:int' process list, spaces allowed around items.
+PROCESS_LIST_PATTERN = re.compile(r"\s*\d+:\d+\s*(?:,\s*\d+:\d+\s*)*")
+PROCESS_ITEM_PATTERN = re.compile(r"(\d+):(\d+)")
+# Keys identifying an input and a feed.
+INPUT_KEYS = ("nodeid", "name")
+FEED_KEYS = ("tag", "name")
+# Filters categories and keys of a filters structure.
+FILTERS_STRUCTURE_KEYS = (
+    ("filter_inputs", "nodeid"),
+    ("filter_inputs", "name"),
+    ("filter_feeds", "tag"),
+    ("filter_feeds", "name"),
+)
+
 
 class EmonFilterItem:
     """
@@ -516,7 +532,7 @@ class EmonPyCore(EmonApiCore):
     @staticmethod
     def is_filters_structure(
         filters: dict
-    ) -> tuple[dict, dict]:
+    ) -> bool:
         """
         Validate if the provided dictionary is a valid filter structure.
 
@@ -524,15 +540,13 @@ class EmonPyCore(EmonApiCore):
             filters (dict): Dictionary containing filters for inputs and feeds.
 
         Returns:
-            tuple[dict, dict]: Validation result as a tuple of dictionaries.
+            bool: True if every filter of FILTERS_STRUCTURE_KEYS is a set.
         """
-        return Ut.is_dict(filters)\
-            and Ut.is_dict(filters.get('filter_inputs'))\
-            and Ut.is_set(filters["filter_inputs"].get('nodeid'))\
-            and Ut.is_set(filters["filter_inputs"].get('name'))\
-            and Ut.is_dict(filters.get('filter_feeds'))\
-            and Ut.is_set(filters["filter_feeds"].get('tag'))\
-            and Ut.is_set(filters["filter_feeds"].get('name'))
+        return Ut.is_dict(filters) and all(
+            Ut.is_dict(filters.get(category))
+            and Ut.is_set(filters[category].get(key))
+            for category, key in FILTERS_STRUCTURE_KEYS
+        )
 
     @staticmethod
     def format_process_with_feed_id(
@@ -606,26 +620,22 @@ class EmonPyCore(EmonApiCore):
         """
         result = set()
         if Ut.is_str(process_list, not_empty=True):
-            process = Ut.get_comma_separated_values_to_list(process_list)
-            if Ut.is_list(process, not_empty=True):
-                try:
-                    process = [
-                        Ut.split_process(item)
-                        for item in process
+            error_msg = (
+                "Error: Malformed processList value. "
+                "ProcessList value must be a string as 'int:int'"
+            )
+            if PROCESS_LIST_PATTERN.fullmatch(process_list) is None:
+                raise ValueError(error_msg)
+            try:
+                result = EmonPyCore.format_process_list(
+                    process_list=[
+                        (int(proc), int(feed_id))
+                        for proc, feed_id
+                        in PROCESS_ITEM_PATTERN.findall(process_list)
                     ]
-                    result = EmonPyCore.format_process_list(
-                        process_list=process
-                    )
-                except (ValueError, TypeError) as ex:
-                    raise ValueError(
-                        "Error: Malformed processList value. "
-                        "ProcessList value must be a string as 'int:int'"
-                    ) from ex
-            else:
-                raise ValueError(
-                    "Error: Malformed processList value. "
-                    "ProcessList value must be a string as 'int:int'"
                 )
+            except (ValueError, TypeError) as ex:
+                raise ValueError(error_msg) from ex
         return result
 
     @staticmethod
@@ -646,14 +656,18 @@ class EmonPyCore(EmonApiCore):
         """
         result = set()
         if Ut.is_list(process_list, not_empty=True):
-            for process in process_list:
-                if isinstance(process, (list, tuple))\
-                        and len(process) == 2:
-                    pid, fid = EmonPyCore.format_process_with_feed_id(
+            result = {
+                f"{pid}:{fid}"
+                for pid, fid in (
+                    EmonPyCore.format_process_with_feed_id(
                         feed_id=process[1],
                         process_id=process[0]
                     )
-                    result.add(f"{pid}:{fid}")
+                    for process in process_list
+                    if isinstance(process, (list, tuple))
+                    and len(process) == 2
+                )
+            }
         return result
 
     @staticmethod
@@ -681,11 +695,102 @@ class EmonPyCore(EmonApiCore):
                     result[item_key] = list(filter_item)[0]
         return result
 
+    @staticmethod
+    def index_list_of_dicts(
+        data: list[dict],
+        keys: tuple[str, str]
+    ) -> dict[tuple, list[tuple[int, dict]]]:
+        """
+        Index a list of dicts by the values of two keys.
+
+        Args:
+            data (list[dict]): List of items to index.
+            keys (tuple[str, str]): Keys to index items by.
+
+        Returns:
+            dict[tuple, list[tuple[int, dict]]]:
+                Items and their position in data, by keys values.
+                Items missing one of the keys are not indexed.
+        """
+        result = {}
+        if Ut.is_list(data, not_empty=True):
+            first, second = keys
+            get_keys = itemgetter(first, second)
+            for position, item in enumerate(data):
+                if first in item and second in item:
+                    result.setdefault(
+                        get_keys(item), []
+                    ).append((position, item))
+        return result
+
+    @staticmethod
+    def index_structure(
+        inputs: list,
+        feeds: list
+    ) -> tuple[dict, dict]:
+        """
+        Index inputs by nodeid and name, and feeds by tag and name.
+
+        Args:
+            inputs (list): List of available inputs.
+            feeds (list): List of available feeds.
+
+        Returns:
+            tuple[dict, dict]: Inputs and feeds indexes.
+        """
+        return (
+            EmonPyCore.index_list_of_dicts(inputs, INPUT_KEYS),
+            EmonPyCore.index_list_of_dicts(feeds, FEED_KEYS)
+        )
+
+    @staticmethod
+    def filter_indexed_list(
+        data: list[dict],
+        index: dict[tuple, list[tuple[int, dict]]],
+        keys: tuple[str, str],
+        filter_data: Optional[dict]
+    ) -> list[dict]:
+        """
+        Filter a list of dicts as `Ut.filter_list_of_dicts` does.
+
+        Filters on both index keys are resolved with index lookups,
+        other filters fall back to a full data scan.
+
+        Args:
+            data (list[dict]): List of items to filter.
+            index (dict): Index of data by keys values.
+            keys (tuple[str, str]): Keys of the index.
+            filter_data (Optional[dict]): Filter values by key.
+
+        Returns:
+            list[dict]: Filtered items, in data order.
+        """
+        filter_data = Ut.clean_filter(filter_data)
+        if not Ut.is_dict(filter_data) or set(filter_data) != set(keys):
+            return Ut.filter_list_of_dicts(
+                data,
+                filter_data=filter_data,
+                filter_in=True
+            )
+        first, second = (
+            value if isinstance(value, (set, list)) else [value]
+            for value in (filter_data[keys[0]], filter_data[keys[1]])
+        )
+        matches = {}
+        for first_value in first:
+            for second_value in second:
+                for position, item in index.get(
+                        (first_value, second_value), []):
+                    matches[position] = item
+        return [matches[position] for position in sorted(matches)]
+
     @staticmethod
     def get_existant_structure(
         input_item: dict,
         inputs: list,
-        feeds: list
+        feeds: list,
+        inputs_index: Optional[dict] = None,
+        feeds_index: Optional[dict] = None
     ):
         """
         Initialize input and feed structures based on the provided item.
@@ -694,6 +799,12 @@ class EmonPyCore(EmonApiCore):
             input_item (dict): Structure item to filter inputs and feeds.
             inputs (list): List of available inputs.
             feeds (list): List of available feeds.
+            inputs_index (Optional[dict]):
+                Inputs index from `index_structure`,
+                built from inputs if not provided.
+            feeds_index (Optional[dict]):
+                Feeds index from `index_structure`,
+                built from feeds if not provided.
 
         Returns:
             tuple[Optional[list], Optional[list]]: Filtered inputs and feeds.
@@ -703,15 +814,23 @@ class EmonPyCore(EmonApiCore):
             structure_item=input_item
         )
         if Ut.is_dict(filters):
-            inputs_on = Ut.filter_list_of_dicts(
+            if inputs_index is None:
+                inputs_index = EmonPyCore.index_list_of_dicts(
+                    inputs, INPUT_KEYS)
+            if feeds_index is None:
+                feeds_index = EmonPyCore.index_list_of_dicts(
+                    feeds, FEED_KEYS)
+            inputs_on = EmonPyCore.filter_indexed_list(
                 inputs,
-                filter_data=filters.get('filter_inputs'),
-                filter_in=True
+                index=inputs_index,
+                keys=INPUT_KEYS,
+                filter_data=filters.get('filter_inputs')
             )
-            feeds_on = Ut.filter_list_of_dicts(
+            feeds_on = EmonPyCore.filter_indexed_list(
                 feeds,
-                filter_data=filters.get('filter_feeds'),
-                filter_in=True
+                index=feeds_index,
+                keys=FEED_KEYS,
+                filter_data=filters.get('filter_feeds')
             )
         return inputs_on, feeds_on
 
@@ -756,14 +875,9 @@ class EmonPyCore(EmonApiCore):
         result = None
         if Ut.is_list(structure, not_empty=True):
             result = {
-                "nodeid": set(),
-                "name": set()
+                "nodeid": {item.get("nodeid") for item in structure},
+                "name": {item.get("name") for item in structure}
             }
-            for item in structure:
-                result["nodeid"].add(
-                    item.get("nodeid"))
-                result["name"].add(
-                    item.get("name"))
             result = EmonPyCore.clean_filters_items(
                 filters=result
             )
@@ -845,11 +959,11 @@ class EmonPyCore(EmonApiCore):
         if Ut.is_list(process_list, not_empty=True)\
                 and Ut.is_list(feed_data, not_empty=True):
             # get feed ids from process list
-            ids = []
+            ids = set()
             for process in process_list:
                 feed_id = process[1]
                 if isinstance(feed_id, int) and feed_id > 0:
-                    ids.append(feed_id)
+                    ids.add(feed_id)
 
             if len(ids) > 0:
                 result = Ut.filter_list_of_dicts(
@@ -903,7 +1017,7 @@ class EmonPyCore(EmonApiCore):
         inputs_on = []
         if Ut.is_list(inputs, not_empty=True)\
                 and Ut.is_list(feeds, not_empty=True):
-            ids = [x.get('id') for x in feeds]
+            ids = {x.get('id') for x in feeds}
             inputs_on = []
             for item in inputs:
                 if len(item['process_list']) > 0:
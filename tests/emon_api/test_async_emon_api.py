@@ -1,11 +1,13 @@
 """Tests for the EmonRequest class using async"""
 from unittest.mock import AsyncMock, patch
+import numpy as np
 from aiohttp import web, ClientSession
 from aiohttp.client_exceptions import ClientError
 import pytest_asyncio
 import pytest
 from emon_tools.emon_api.emon_api_core import InputGetType
 from emon_tools.emon_api.emon_api_core import RequestType
+from emon_tools.emon_api.circuit_breaker import CircuitState
 from emon_tools.emon_api.async_emon_api import AsyncEmonRequest
 from emon_tools.emon_api.async_emon_api import AsyncEmonInputs
 from emon_tools.emon_api.async_emon_api import AsyncEmonFeeds
@@ -132,6 +134,55 @@ class TestAsyncEmonRequest:
             assert response["success"] is False
             assert "client error" in response["message"]
 
+    @pytest.mark.asyncio
+    async def test_async_request_circuit_open(self, mock_emon_request):
+        """Test async_request stops calling a down server."""
+        with patch(
+                "aiohttp.ClientSession.get",
+                side_effect=[ClientError("Mock client error")] * 10
+                ) as mock_get:
+            for _ in range(5):
+                response = await mock_emon_request.async_request(
+                    "/valid-path", msg='test async')
+                assert "client error" in response["message"]
+            assert mock_emon_request.circuit_breaker.state\
+                == CircuitState.OPEN
+            response = await mock_emon_request.async_request(
+                "/valid-path", msg='test async')
+            assert response == {
+                "success": False,
+                "message": "Circuit open: test async."
+            }
+            assert mock_get.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_async_request_circuit_open_without_msg(
+        self,
+        mock_emon_request
+    ):
+        """Test the circuit open message of a request without msg."""
+        mock_emon_request.circuit_breaker.failure_threshold = 1
+        mock_emon_request.circuit_breaker.record_failure()
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            response = await mock_emon_request.async_request("/valid-path")
+        assert response == {"success": False, "message": "Circuit open."}
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_request_unauthorized_keep_circuit_closed(
+        self,
+        aiohttp_server_mock,
+        mock_emon_request
+    ):
+        """Test authentication failures never open the circuit."""
+        mock_emon_request.url = str(aiohttp_server_mock.make_url("/"))
+        mock_emon_request.api_key = INVALID_API_KEY
+        for _ in range(6):
+            response = await mock_emon_request.async_request("/valid-path")
+            assert "unauthorized" in response["message"]
+        assert mock_emon_request.circuit_breaker.state\
+            == CircuitState.CLOSED
+
     @pytest.mark.asyncio
     async def test_close_session(self, mock_emon_request):
         """Test closing of the aiohttp session."""
@@ -323,7 +374,7 @@ class TestAsyncEmonInputs:
                 path='/input/bulk',
                 params={},
                 data={
-                    'data': '[[1, "test_node", {"temp": 21.2}, {"humidity": 54}]]'
+                    'data': '[[1,"test_node",{"temp":21.2},{"humidity":54}]]'
                 },
                 msg="input_bulk",
                 request_type=RequestType.POST
@@ -559,6 +610,27 @@ class TestAsyncEmonFeeds:
                 msg="add feed data points"
             )
 
+    @pytest.mark.asyncio
+    async def test_add_data_points_numpy(self, emon_feeds):
+        """Test adding data points to a feed from a NumPy array."""
+        timestamps = np.arange(1609459200, 1609459200 + 10000 * 60, 60)
+        values = np.arange(10000, dtype=np.float64) / 2
+        expected = [
+            [1609459200 + i * 60, i / 2]
+            for i in range(10000)
+        ]
+        with patch.object(
+                emon_feeds,
+                "async_request",
+                return_value=dtest.MOCK_RESPONSE_SUCCESS) as mock_request:
+            result = await emon_feeds.async_add_data_points(
+                feed_id=123,
+                data=np.column_stack([timestamps, values]))
+            assert result == dtest.MOCK_RESPONSE_SUCCESS
+            data = mock_request.call_args.kwargs["params"]["data"]
+            assert data == expected
+            assert isinstance(data[0][0], int)
+
     @pytest.mark.asyncio
     async def test_delete_data_point(self, emon_feeds):
         """Test deleting a data point from a feed."""
@@ -0,0 +1,77 @@
+"""Tests for the CircuitBreaker class"""
+from unittest.mock import patch
+from emon_tools.emon_api.circuit_breaker import CircuitBreaker
+from emon_tools.emon_api.circuit_breaker import CircuitState
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker unit test class"""
+    def test_open_after_threshold(self):
+        """Test circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+        for _ in range(2):
+            breaker.record_failure()
+            assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+
+    def test_success_reset_failures(self):
+        """Test a success resets the failures counter."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+
+    @patch("emon_tools.emon_api.circuit_breaker.time.monotonic")
+    def test_half_open_after_recovery_timeout(self, mock_monotonic):
+        """Test half open state after recovery timeout."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        mock_monotonic.return_value = 129.0
+        assert breaker.allow_request() is False
+        mock_monotonic.return_value = 130.0
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitState.HALF_OPEN
+        # A failed trial request opens the circuit again.
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+        mock_monotonic.return_value = 160.0
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    @patch("emon_tools.emon_api.circuit_breaker.time.monotonic")
+    def test_half_open_single_trial(self, mock_monotonic):
+        """Test half open circuit lets a single trial request through."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        mock_monotonic.return_value = 130.0
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitState.HALF_OPEN
+        # Concurrent requests wait for the trial request result.
+        assert breaker.allow_request() is False
+        mock_monotonic.return_value = 135.0
+        assert breaker.allow_request() is False
+        breaker.record_success()
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is True
+
+    @patch("emon_tools.emon_api.circuit_breaker.time.monotonic")
+    def test_half_open_lost_trial(self, mock_monotonic):
+        """Test a new trial is allowed if the trial is never recorded."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        mock_monotonic.return_value = 130.0
+        assert breaker.allow_request() is True
+        mock_monotonic.return_value = 159.0
+        assert breaker.allow_request() is False
+        mock_monotonic.return_value = 160.0
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
@@ -1,5 +1,9 @@
-"""emon_api unit test module."""
-from unittest.mock import patch, MagicMock
+"""emon_api unit test module.
+
+PYTEST_DONT_REWRITE
+"""
+from types import SimpleNamespace
+from unittest.mock import patch, call
 import pytest
 import requests
 from emon_tools.emon_api.api_utils import MESSAGE_KEY, SUCCESS_KEY
@@ -15,45 +19,44 @@ MOCK_RESPONSE_SUCCESS = {"success": True, "message": "Request succeeded"}
 MOCK_RESPONSE_FAIL = {"success": False, "message": "Request failed"}
 
 
+def make_response(status_code: int, body: dict) -> SimpleNamespace:
+    """Create a lightweight requests response stand-in."""
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={"Content-Type": "application/json"},
+        json=lambda: body
+    )
+
+
+OK_RESPONSE = make_response(200, MOCK_RESPONSE_SUCCESS)
+FAIL_RESPONSE = make_response(404, MOCK_RESPONSE_FAIL)
+
+
+@pytest.fixture(scope="class")
+def http_patchers():
+    """Patch requests get and post once for the requesting test class."""
+    get_patcher = patch("emon_tools.emon_api.emon_api.requests.get")
+    post_patcher = patch("emon_tools.emon_api.emon_api.requests.post")
+    yield get_patcher.start(), post_patcher.start()
+    get_patcher.stop()
+    post_patcher.stop()
+
+
 class TestEmonRequest:
     """Unit test class for EmonRequest."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def emon_request(self):
         """Fixture to initialize an EmonRequest instance."""
         return EmonRequest(VALID_URL, API_KEY)
 
-    @pytest.mark.parametrize(
-        "path,expected_url",
-        [
-            ("/feed/list.json", "http://example.com/feed/list.json"),
-            ("feed/list.json", "http://example.com/feed/list.json"),
-        ],
-    )
-    def test_execute_request_path_validation(
-        self,
-        path,
-        expected_url,
-        emon_request
-    ):
-        """Test that the URL is correctly formed."""
-        with patch("emon_tools.emon_api.emon_api.requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_RESPONSE_SUCCESS
-            mock_get.return_value = mock_response
-
-            emon_request.execute_request(path=path, msg="test path validation")
-
-            mock_get.assert_called_once_with(
-                expected_url,
-                params={"apikey": API_KEY},
-                headers={
-                    "content-type": "application/x-www-form-urlencoded",
-                    "charset": "UTF-8",
-                },
-                timeout=20,
-            )
+    @pytest.fixture
+    def http_mocks(self, http_patchers):
+        """Reset the shared requests get and post mocks for one test."""
+        for mock in http_patchers:
+            mock.reset_mock(return_value=True, side_effect=True)
+            mock.return_value = OK_RESPONSE
+        return http_patchers
 
     @pytest.mark.parametrize(
         "status_code,expected_success,expected_message",
@@ -74,11 +77,7 @@ class TestEmonRequest:
         emon_request
     ):
         """Test response computation."""
-        response_mock = MagicMock()
-        response_mock.status_code = status_code
-        response_mock.json.return_value = (
-            MOCK_RESPONSE_SUCCESS if status_code == 200 else MOCK_RESPONSE_FAIL
-        )
+        response_mock = OK_RESPONSE if status_code == 200 else FAIL_RESPONSE
         with patch(
                 "emon_tools.emon_api.emon_api_core.EmonRequestCore.compute_response",
                 return_value={
@@ -96,86 +95,99 @@ class TestEmonRequest:
                 ValueError, match="Path must be a non-empty string."):
             emon_request.execute_request(path=None, msg="Invalid path")
 
+    @pytest.mark.error_path
+    def test_execute_request_timeout(self, emon_request, http_mocks):
+        """Test handling of request timeouts."""
+        mock_get, _ = http_mocks
+        mock_get.side_effect = requests.exceptions.Timeout
+        result = emon_request.execute_request(
+            path="/feed/list.json", msg="test_timeout")
+        assert not result["success"]
+        assert result["message"] == "Request timeout: test_timeout."
+
+    @pytest.mark.error_path
+    def test_execute_request_connection_error(self, emon_request, http_mocks):
+        """Test handling of connection errors."""
+        mock_get, _ = http_mocks
+        mock_get.side_effect = requests.exceptions.ConnectionError(
+            "Connection error")
+        result = emon_request.execute_request(
+            path="/feed/list.json", msg="test connection error")
+        assert not result["success"]
+        assert "Connection error" in result["message"]
+
     @pytest.mark.parametrize(
-        "params,expected_params",
+        "path,params,request_type,expected_url,expected_params",
         [
-            (None, {"apikey": API_KEY}),
-            ({"key": "value"}, {"apikey": API_KEY, "key": "value"}),
+            pytest.param(
+                "/feed/list.json", None, RequestType.GET,
+                "http://example.com/feed/list.json", {"apikey": API_KEY},
+                id="path-leading-slash"
+            ),
+            pytest.param(
+                "feed/list.json", None, RequestType.GET,
+                "http://example.com/feed/list.json", {"apikey": API_KEY},
+                id="path-no-leading-slash"
+            ),
+            pytest.param(
+                "/feed/list.json", {"key": "value"}, RequestType.GET,
+                "http://example.com/feed/list.json",
+                {"apikey": API_KEY, "key": "value"},
+                id="params-encoding"
+            ),
+            pytest.param(
+                "/feed/list.json", None, RequestType.POST,
+                "http://example.com/feed/list.json", {"apikey": API_KEY},
+                id="request-type-post"
+            ),
         ],
     )
-    def test_execute_request_params_encoding(
+    def test_execute_request(
         self,
         emon_request,
+        http_mocks,
+        path,
         params,
+        request_type,
+        expected_url,
         expected_params
     ):
-        """Test parameter encoding."""
-        with patch("requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_RESPONSE_SUCCESS
-            mock_get.return_value = mock_response
-
-            emon_request.execute_request(
-                path="/feed/list.json",
-                params=params,
-                msg="test params encoding")
+        """Test url, params encoding and request type of requests."""
+        mock_get, mock_post = http_mocks
+        emon_request.execute_request(
+            path=path,
+            params=params,
+            msg="test execute request",
+            request_type=request_type
+        )
 
+        headers = {
+            "content-type": "application/x-www-form-urlencoded",
+            "charset": "UTF-8",
+        }
+        if request_type == RequestType.GET:
             mock_get.assert_called_once_with(
-                "http://example.com/feed/list.json",
+                expected_url,
                 params=expected_params,
-                headers={
-                    "content-type": "application/x-www-form-urlencoded",
-                    "charset": "UTF-8",
-                },
+                headers=headers,
                 timeout=20,
             )
-
-    def test_execute_request_timeout(self, emon_request):
-        """Test handling of request timeouts."""
-        with patch("requests.get", side_effect=requests.exceptions.Timeout):
-            result = emon_request.execute_request(
-                path="/feed/list.json", msg="test_timeout")
-            assert not result["success"]
-            assert result["message"] == "Request timeout: test_timeout."
-
-    def test_execute_request_connection_error(self, emon_request):
-        """Test handling of connection errors."""
-        with patch(
-                "requests.get",
-                side_effect=requests.exceptions.ConnectionError(
-                    "Connection error")):
-            result = emon_request.execute_request(
-                path="/feed/list.json", msg="test connection error")
-            assert not result["success"]
-            assert "Connection error" in result["message"]
-
-    @pytest.mark.parametrize(
-            "request_type", [RequestType.GET, RequestType.POST])
-    def test_execute_request_request_type(self, emon_request, request_type):
-        """Test execution for different request types."""
-        with patch(
-                "requests.get"
-                if request_type == RequestType.GET
-                else "requests.post") as mock_request:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_RESPONSE_SUCCESS
-            mock_request.return_value = mock_response
-
-            emon_request.execute_request(
-                path="/feed/list.json",
-                msg="test request type",
-                request_type=request_type
+            mock_post.assert_not_called()
+        else:
+            mock_post.assert_called_once_with(
+                expected_url,
+                params=expected_params,
+                data=None,
+                headers=headers,
+                timeout=20,
             )
-
-            mock_request.assert_called_once()
+            mock_get.assert_not_called()
 
 
 class TestEmonInputsApi:
     """Unit test class for EmonInputsApi."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def emon_inputs_api(self):
         """Fixture to initialize an EmonInputsApi instance."""
         return EmonInputsApi(VALID_URL, API_KEY)
@@ -269,7 +281,7 @@ class TestEmonInputsApi:
                 "execute_request",
                 return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
             with patch(
-                    "simplejson.dumps", side_effect=lambda x: '{"key": 123}'):
+                    "simplejson.dumps", return_value='{"key": 123}'):
                 result = emon_inputs_api.post_inputs(
                     node="test_node", data={"key": 123})
                 assert result == MOCK_RESPONSE_SUCCESS
@@ -294,218 +306,192 @@ class TestEmonInputsApi:
                 path='/input/bulk',
                 params={},
                 data={
-                    'data': '[[1, "test_node", {"temp": 21.2}, {"humidity": 54}]]'},
+                    'data': '[[1,"test_node",{"temp":21.2},{"humidity":54}]]'},
                 msg="input_bulk",
                 request_type=RequestType.POST
             )
 
 
+FEEDS_API_CASES = (
+    (
+        "list_feeds",
+        {},
+        call(path='/feed/list.json', msg="get list feeds")
+    ),
+    (
+        "get_feed_fields",
+        {"feed_id": 123},
+        call(
+            path='/feed/aget.json',
+            params={"id": 123},
+            msg="get feed fields"
+        )
+    ),
+    (
+        "get_feed_meta",
+        {"feed_id": 123},
+        call(
+            '/feed/getmeta.json',
+            params={"id": 123},
+            msg="get feed meta"
+        )
+    ),
+    (
+        "get_last_value_feed",
+        {"feed_id": 123},
+        call(
+            '/feed/timevalue.json',
+            params={"id": 123},
+            msg="get last feed value"
+        )
+    ),
+    (
+        "get_fetch_feed_data",
+        {
+            "feed_id": 123,
+            "start": 1609459200,
+            "end": 1609462800,
+            "interval": 10,
+            "average": True,
+            "time_format": "unix",
+            "skip_missing": False,
+            "limi_interval": False,
+            "delta": False
+        },
+        call(
+            "/feed/data.json",
+            params={
+                "id": 123,
+                "start": 1609459200,
+                "end": 1609462800,
+                "interval": 10,
+                "average": 1,
+                "time_format": "unix",
+                "skip_missing": 0,
+                "limit_interval": 0,
+                "delta": 0,
+            },
+            msg="fetch data points"
+        )
+    ),
+    (
+        "create_feed",
+        {
+            "name": "test_feed",
+            "tag": "test_tag",
+            "engine": 1,
+            "options": {"type": "float"}
+        },
+        call(
+            path='/feed/create.json',
+            params={
+                "name": "test_feed",
+                "tag": "test_tag",
+                "engine": 1, "options": {"type": "float"}},
+            msg="create feed",
+            request_type=RequestType.GET
+        )
+    ),
+    (
+        "update_feed",
+        {"feed_id": 123, "fields": {"key": "value"}},
+        call(
+            path='/feed/set.json',
+            params={"feed_id": 123, "fields": {"key": "value"}},
+            msg="update feed fields"
+        )
+    ),
+    (
+        "delete_feed",
+        {"feed_id": 123},
+        call(
+            path='/feed/delete.json',
+            params={"id": 123},
+            msg="delete feed"
+        )
+    ),
+    (
+        "add_data_point",
+        {"feed_id": 123, "time": 1609459200, "value": 42.0},
+        call(
+            path='/feed/insert.json',
+            params={"feed_id": 123, "time": 1609459200, "value": 42.0},
+            msg="add feed data point"
+        )
+    ),
+    (
+        "add_data_points",
+        {
+            "feed_id": 123,
+            "data": [[1609459200, 42.0], [1609459260, 43.0]]
+        },
+        call(
+            path='/feed/insert.json',
+            params={
+                "feed_id": 123,
+                "data": [[1609459200, 42.0], [1609459260, 43.0]]},
+            msg="add feed data points"
+        )
+    ),
+    (
+        "delete_data_point",
+        {"feed_id": 123, "time": 1609459200},
+        call(
+            path='/feed/deletedatapoint.json',
+            params={"feed_id": 123, "time": 1609459200},
+            msg="delete feed data point"
+        )
+    ),
+    (
+        "add_feed_process_list",
+        {"feed_id": 123, "process_id": 1, "process": 2},
+        call(
+            path="/feed/process/set.json",
+            params={"feed_id": 123, "processlist": '2:1'},
+            msg="add_feed_process_list"
+        )
+    ),
+)
+
+
 class TestEmonFeedsApi:
     """Unit test class for EmonFeedsApi."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def emon_feeds_api(self):
         """Fixture to initialize an EmonFeedsApi instance."""
         return EmonFeedsApi(VALID_URL, API_KEY)
 
-    def test_list_feeds(self, emon_feeds_api):
-        """Test listing feeds."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.list_feeds()
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/list.json',
-                msg="get list feeds"
-            )
-
-    def test_get_feed_fields(self, emon_feeds_api):
-        """Test retrieving specific feed fields."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.get_feed_fields(feed_id=123)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/aget.json',
-                params={"id": 123},
-                msg="get feed fields"
-            )
-
-    def test_get_feed_meta(self, emon_feeds_api):
-        """Test retrieving metadata for a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.get_feed_meta(feed_id=123)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                '/feed/getmeta.json',
-                params={"id": 123},
-                msg="get feed meta"
-            )
-
-    def test_get_last_value_feed(self, emon_feeds_api):
-        """Test retrieving the last value for a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.get_last_value_feed(feed_id=123)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                '/feed/timevalue.json',
-                params={"id": 123},
-                msg="get last feed value"
-            )
-
-    def test_get_fetch_feed_data(self, emon_feeds_api):
-        """Test fetching feed data."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.get_fetch_feed_data(
-                feed_id=123,
-                start=1609459200,
-                end=1609462800,
-                interval=10,
-                average=True,
-                time_format="unix",
-                skip_missing=False,
-                limi_interval=False,
-                delta=False
-            )
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                "/feed/data.json",
-                params={
-                    "id": 123,
-                    "start": 1609459200,
-                    "end": 1609462800,
-                    "interval": 10,
-                    "average": 1,
-                    "time_format": "unix",
-                    "skip_missing": 0,
-                    "limit_interval": 0,
-                    "delta": 0,
-                },
-                msg="fetch data points"
-            )
-
-    def test_create_feed(self, emon_feeds_api):
-        """Test creating a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.create_feed(
-                name="test_feed",
-                tag="test_tag",
-                engine=1,
-                options={"type": "float"})
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/create.json',
-                params={
-                    "name": "test_feed",
-                    "tag": "test_tag",
-                    "engine": 1, "options": {"type": "float"}},
-                msg="create feed",
-                request_type=RequestType.GET
-            )
-
-    def test_update_feed(self, emon_feeds_api):
-        """Test updating a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.update_feed(
-                feed_id=123, fields={"key": "value"})
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/set.json',
-                params={"feed_id": 123, "fields": {"key": "value"}},
-                msg="update feed fields"
-            )
+    @pytest.fixture(scope="module")
+    def execute_patcher(self):
+        """Patch EmonFeedsApi.execute_request once for the test module."""
+        patcher = patch.object(
+            EmonFeedsApi,
+            "execute_request",
+            return_value=MOCK_RESPONSE_SUCCESS)
+        yield patcher.start()
+        patcher.stop()
 
-    def test_delete_feed(self, emon_feeds_api):
-        """Test deleting a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.delete_feed(feed_id=123)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/delete.json',
-                params={"id": 123},
-                msg="delete feed"
-            )
-
-    def test_add_data_point(self, emon_feeds_api):
-        """Test adding a data point to a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.add_data_point(
-                feed_id=123, time=1609459200, value=42.0)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/insert.json',
-                params={"feed_id": 123, "time": 1609459200, "value": 42.0},
-                msg="add feed data point"
-            )
-
-    def test_add_data_points(self, emon_feeds_api):
-        """Test adding multiple data points to a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.add_data_points(
-                feed_id=123, data=[[1609459200, 42.0], [1609459260, 43.0]])
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/insert.json',
-                params={
-                    "feed_id": 123,
-                    "data": [[1609459200, 42.0], [1609459260, 43.0]]},
-                msg="add feed data points"
-            )
-
-    def test_delete_data_point(self, emon_feeds_api):
-        """Test deleting a data point from a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.delete_data_point(
-                feed_id=123, time=1609459200)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path='/feed/deletedatapoint.json',
-                params={"feed_id": 123, "time": 1609459200},
-                msg="delete feed data point"
-            )
+    @pytest.fixture
+    def mock_request(self, execute_patcher):
+        """Reset the shared execute_request mock for one test."""
+        execute_patcher.reset_mock()
+        return execute_patcher
 
-    def test_add_feed_process_list(self, emon_feeds_api):
-        """Test adding a process list to a feed."""
-        with patch.object(
-                emon_feeds_api,
-                "execute_request",
-                return_value=MOCK_RESPONSE_SUCCESS) as mock_request:
-            result = emon_feeds_api.add_feed_process_list(
-                feed_id=123, process_id=1, process=2)
-            assert result == MOCK_RESPONSE_SUCCESS
-            mock_request.assert_called_once_with(
-                path="/feed/process/set.json",
-                params={"feed_id": 123, "processlist": '2:1'},
-                msg="add_feed_process_list"
-            )
+    @pytest.mark.parametrize(
+        "method,kwargs,expected_call",
+        FEEDS_API_CASES,
+        ids=[case[0] for case in FEEDS_API_CASES]
+    )
+    def test_feeds_api_method(
+        self,
+        emon_feeds_api,
+        mock_request,
+        method,
+        kwargs,
+        expected_call
+    ):
+        """Test feeds api methods requests."""
+        result = getattr(emon_feeds_api, method)(**kwargs)
+        assert result == MOCK_RESPONSE_SUCCESS
+        assert mock_request.call_args_list == [expected_call]
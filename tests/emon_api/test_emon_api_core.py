@@ -1,4 +1,15 @@
 """Tests for the EmonRequest class using async"""
+from dataclasses import dataclass
+import datetime as dt
+from decimal import Decimal
+import re
+import string
+from types import MappingProxyType
+from unittest.mock import patch
+import uuid
+from hypothesis import given
+from hypothesis import strategies as st
+import numpy as np
 import pytest
 from emon_tools.emon_api.api_utils import MESSAGE_KEY
 from emon_tools.emon_api.api_utils import SUCCESS_KEY
@@ -8,81 +19,307 @@ from emon_tools.emon_api.emon_api_core import EmonRequestCore
 from emon_tools.emon_api.emon_api_core import EmonInputsCore
 from emon_tools.emon_api.emon_api_core import EmonFeedsCore
 
+# Alphanumeric api keys strategy
+API_KEYS = st.text(
+    alphabet=string.ascii_letters + string.digits, min_size=1)
+# Hostname label strategy, alphanumeric at both ends
+HOST_LABELS = st.from_regex(
+    r"[a-z0-9](?:[a-z0-9-]{0,20}[a-z0-9])?", fullmatch=True)
+# Valid urls strategy, with optional port and trailing slashes
+URLS = st.builds(
+    "{}{}{}{}".format,
+    st.sampled_from(("http://", "https://")),
+    st.lists(HOST_LABELS, min_size=1, max_size=4).map(".".join),
+    st.one_of(st.just(""), st.integers(1, 65535).map(":{}".format)),
+    st.sampled_from(("", "/", "//"))
+)
+INVALID_API_KEYS = (
+    (
+        123, ValueError,
+        "API key must be a non-empty alphanumeric string."
+    ),
+    (
+        "ftp://", ValueError,
+        "API key must be a non-empty alphanumeric string."
+    ),
+)
+INVALID_URLS = (
+    (
+        123, TypeError,
+        "URL must be a non-empty string."
+    ),
+    (
+        "ftp://", ValueError,
+        "URL must start with 'http://' or 'https://'."
+    ),
+)
+INVALID_INPUT_FIELDS = (
+    ("", "Input1", ValueError),
+    ("Node1", "", ValueError),
+    ("", "", ValueError),
+)
+INVALID_INPUT_PROCESS_LISTS = (
+    (
+        "123", "",
+        ValueError,
+        "Input Id must be an integer."
+    ),
+    (
+        123, None,
+        ValueError,
+        "Invalid data to post inputs."
+    ),
+    (
+        "", "process1:1,process2:2",
+        ValueError,
+        "Input Id must be an integer."
+    ),
+)
+INVALID_POST_INPUTS = (
+    ("Node1", {}, ValueError),
+    ("Node1", None, ValueError),
+    ("", {"key1": 1}, TypeError),
+)
+# Input bulk error messages patterns, compiled once
+ERR_INVALID_DATA = re.compile(r"Invalid data to post inputs\.")
+ERR_BULK_TIMESTAMP = re.compile(
+    r"inputBulkTime timestamp must be a non-negative number\.")
+ERR_BULK_SENTAT = re.compile(r"inputBulkSentat must be an integer\.")
+ERR_BULK_OFFSET = re.compile(r"inputBulkOffset must be an integer\.")
+ERR_UNIQUE_FORMAT = re.compile(r"You must chose an unique format.*")
+ERR_NON_FINITE = re.compile(r"Out of range float values")
+PREP_INPUT_BULK_CASES = (
+    pytest.param(
+        {
+            "data": ["test"],
+            "timestamp": None,
+            "sentat": None,
+            "offset": None
+        },
+        (
+            "/input/bulk", {}, {"data": '["test"]'}
+        ),
+        False, None, None,
+        id="valid"
+    ),
+    pytest.param(
+        {
+            "data": [[0, "node", {"key": 1.5}]],
+            "timestamp": 1609459200,
+            "sentat": None,
+            "offset": None
+        },
+        (
+            "/input/bulk",
+            {"time": 1609459200},
+            {"data": '[[0,"node",{"key":1.5}]]'}
+        ),
+        False, None, None,
+        id="valid-compact"
+    ),
+    pytest.param(
+        {
+            "data": [[0, "node", float("nan")]],
+            "timestamp": None,
+            "sentat": None,
+            "offset": None
+        },
+        (),
+        True, ValueError, ERR_NON_FINITE,
+        id="non-finite-data"
+    ),
+    pytest.param(
+        {
+            "data": [],
+            "timestamp": None,
+            "sentat": None,
+            "offset": None
+        },
+        (),
+        True, ValueError, ERR_INVALID_DATA,
+        id="empty-data"
+    ),
+    pytest.param(
+        {
+            "data": {"a": "1"},
+            "timestamp": None,
+            "sentat": None,
+            "offset": None
+        },
+        (),
+        True, ValueError, ERR_INVALID_DATA,
+        id="bad-data-type"
+    ),
+    pytest.param(
+        {
+            "data": ["test"],
+            "timestamp": -1,
+            "sentat": None,
+            "offset": None
+        },
+        (),
+        True, ValueError,
+        ERR_BULK_TIMESTAMP,
+        id="negative-timestamp"
+    ),
+    pytest.param(
+        {
+            "data": ["test"],
+            "timestamp": None,
+            "sentat": "-1",
+            "offset": None
+        },
+        (),
+        True, ValueError,
+        ERR_BULK_SENTAT,
+        id="bad-sentat-type"
+    ),
+    pytest.param(
+        {
+            "data": ["test"],
+            "timestamp": None,
+            "sentat": None,
+            "offset": "-1"
+        },
+        (),
+        True, ValueError,
+        ERR_BULK_OFFSET,
+        id="bad-offset-type"
+    ),
+    pytest.param(
+        {
+            "data": ["test"],
+            "timestamp": 2,
+            "sentat": 1,
+            "offset": 1
+        },
+        (),
+        True, ValueError,
+        ERR_UNIQUE_FORMAT,
+        id="ambiguous-format"
+    ),
+)
+
+
+@dataclass
+class JsonPoint:
+    """Dataclass json payload, not serializable by simplejson."""
+    time: int
+    value: float
+
+
+# Payloads both json backends must serialize or reject alike
+JSON_BACKEND_PAYLOADS = (
+    pytest.param([[1, "node", {"key": 1.5}]], id="plain"),
+    pytest.param({"a": None, "b": "null", 1: [True, False]}, id="nulls"),
+    pytest.param([1e20, -1e-7, 5e-324, 0.0, -0.0, 1e16], id="exponents"),
+    pytest.param([2**64, -2**63 - 1], id="big-ints"),
+    pytest.param({1.5: "a", True: "b", None: "c"}, id="keys"),
+    pytest.param([Decimal("1.5")], id="decimal"),
+    pytest.param([float("nan")], id="nan"),
+    pytest.param([dt.datetime(2025, 1, 1)], id="datetime"),
+    pytest.param([dt.date(2025, 1, 1)], id="date"),
+    pytest.param([InputGetType.EXTENDED], id="enum"),
+    pytest.param([uuid.UUID(int=1)], id="uuid"),
+    pytest.param([JsonPoint(1, 1.5)], id="dataclass"),
+    pytest.param([np.float64(1.5)], id="numpy-float"),
+)
+# Feed data points, shared as input and expected prep result
+SAMPLE_POINTS = ((1609459200, 123.45), (1609545600, 678.90))
+INVALID_FEEDS_CASES = (
+    pytest.param(
+        EmonFeedsCore.prep_feed_fields, (-1,), {}, id="fields-neg"),
+    pytest.param(EmonFeedsCore.prep_feed_meta, (0,), {}, id="meta-zero"),
+    pytest.param(
+        EmonFeedsCore.prep_last_value_feed, (-10,), {}, id="lastval-neg"),
+    pytest.param(
+        EmonFeedsCore.prep_fetch_feed_data,
+        (-1, 1609459200, 1609545600, 60, False), {},
+        id="fetch-neg"
+    ),
+    pytest.param(
+        EmonFeedsCore.prep_create_feed, (), {"name": "", "tag": "tag"},
+        id="create-empty-name"
+    ),
+    pytest.param(
+        EmonFeedsCore.prep_update_feed,
+        (), {"feed_id": 1, "fields": {"name": "@123 /$*ù"}},
+        id="update-bad-name"
+    ),
+    pytest.param(
+        EmonFeedsCore.prep_delete_feed, (), {"feed_id": -5},
+        id="delete-neg"
+    ),
+    pytest.param(
+        EmonFeedsCore.prep_add_data_point,
+        (), {"feed_id": 1, "time": 1609459200, "value": "abc"},
+        id="add-bad-value"
+    ),
+    pytest.param(
+        EmonFeedsCore.prep_add_data_points,
+        (), {"feed_id": 1, "data": [[1609459200, "abc"]]},
+        id="add-points-bad-value"
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def fetch_feed_common_fields():
+    """Fields common to every prep_fetch_feed_data result."""
+    return MappingProxyType({
+        "time_format": "unix",
+        "skip_missing": 0,
+        "limit_interval": 0,
+        "delta": 0
+    })
+
+
+@pytest.fixture(scope="session", params=[
+    ("prep_feed_fields", "/feed/aget.json"),
+    ("prep_feed_meta", "/feed/getmeta.json"),
+    ("prep_last_value_feed", "/feed/timevalue.json"),
+], ids=["fields", "meta", "lastval"])
+def feed_id_method(request):
+    """EmonFeedsCore prep methods taking a feed id, and their path."""
+    method_name, path = request.param
+    return getattr(EmonFeedsCore, method_name), path
+
 
 class TestEmonApiCore:
     """Tests for Utils class."""
 
-    @pytest.mark.parametrize(
-        "api_key",
-        [
-            (
-                "123"
-            ),
-            (
-                "abcdef"
-            ),
-        ],
-    )
-    def test_validate_api_key_valid(
-        self,
-        api_key
-    ):
-        """Test API key validation with a valid key."""
-        validated_key = EmonApiCore.validate_api_key(api_key)
-        assert validated_key == api_key
-
-    @pytest.mark.parametrize(
-        "api_key, expected_exception, error_msg",
-        [
-            (
-                123, ValueError,
-                "API key must be a non-empty alphanumeric string."
-            ),
-            (
-                "ftp://", ValueError,
-                "API key must be a non-empty alphanumeric string."
-            ),
-        ],
-    )
-    def test_validate_api_key_invalid(
-        self,
-        api_key,
-        expected_exception,
-        error_msg
-    ):
-        """Test API key validation with an invalid key."""
-        with pytest.raises(
-                expected_exception,
-                match=error_msg):
-            EmonApiCore.validate_api_key(api_key)
-
-    def test_validate_url_valid(self):
-        """Test URL validation with a valid URL."""
-        validated_url = EmonApiCore.validate_url("http://localhost:8080")
-        assert validated_url == "http://localhost:8080"
+    @given(api_key=API_KEYS)
+    def test_validate_api_key_valid(self, api_key):
+        """Test API key validation with valid keys."""
+        assert EmonApiCore.validate_api_key(api_key) == api_key
 
-    @pytest.mark.parametrize(
-        "url, expected_exception, error_msg",
-        [
-            (
-                123, TypeError,
-                "URL must be a non-empty string."
-            ),
-            (
-                "ftp://", ValueError,
-                "URL must start with 'http://' or 'https://'."
-            ),
-        ],
-    )
-    def test_validate_url_invalid(
-        self,
-        url,
-        expected_exception,
-        error_msg
-    ):
-        """Test URL validation with an invalid URL."""
-        with pytest.raises(expected_exception, match=error_msg):
-            EmonApiCore.validate_url(url)
+    def test_validate_api_key_invalid(self):
+        """Test API key validation with invalid keys."""
+        for api_key, expected_exception, error_msg in INVALID_API_KEYS:
+            with pytest.raises(expected_exception, match=error_msg):
+                EmonApiCore.validate_api_key(api_key)
+
+    @given(url=URLS)
+    def test_validate_url_valid(self, url):
+        """Test URL validation with valid URLs."""
+        assert EmonApiCore.validate_url(url) == url.rstrip("/")
+
+    def test_validate_url_cached(self):
+        """Test URL validation results are cached for valid URLs only."""
+        url = "http://cached.example.com/"
+        hits = EmonApiCore._sanitize_url.cache_info().hits
+        assert EmonApiCore.validate_url(url) == "http://cached.example.com"
+        assert EmonApiCore.validate_url(url) == "http://cached.example.com"
+        assert EmonApiCore._sanitize_url.cache_info().hits == hits + 1
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                EmonApiCore.validate_url("ftp://cached.example.com")
+
+    def test_validate_url_invalid(self):
+        """Test URL validation with invalid URLs."""
+        for url, expected_exception, error_msg in INVALID_URLS:
+            with pytest.raises(expected_exception, match=error_msg):
+                EmonApiCore.validate_url(url)
 
     @pytest.mark.parametrize(
         "data, expected_result",
@@ -196,6 +433,15 @@ class TestEmonRequestCore:
                 "http://127.0.0.1:8080/abc/d+e+f",
                 False, None, None
             ),
+            (
+                {
+                    "url": "http://127.0.0.1:8080",
+                    "path": "input/get/nodé&a=1",
+                    "msg": "encode_url_test"
+                },
+                "http://127.0.0.1:8080/input/get/nod%C3%A9%26a%3D1",
+                False, None, None
+            ),
             (
                 {
                     "url": "http://127.0.0.1:8080",
@@ -258,6 +504,54 @@ class TestEmonRequestCore:
         assert EmonRequestCore.encode_params(
             **params) == expected_response
 
+    @pytest.mark.parametrize(
+        "value, expected_response",
+        [
+            (["value1"], '["value1"]'),
+            ({"key": 1}, '{"key":1}'),
+            ({1: "a"}, '{"1":"a"}'),
+            ([Decimal("1.5")], '[1.5]'),
+            ([1, None, "é"], '[1,null,"é"]'),
+        ]
+    )
+    def test_dumps_json(self, value, expected_response):
+        """Test JSON serialization, with and without orjson."""
+        assert EmonRequestCore.dumps_json(value) == expected_response
+        with patch("emon_tools.emon_api.emon_api_core.orjson", None):
+            assert EmonRequestCore.dumps_json(value) == expected_response
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [float("nan")],
+            {"key": float("inf")},
+            [[1, None], [2, float("-inf")]],
+        ]
+    )
+    def test_dumps_json_non_finite(self, value):
+        """Test non-finite floats are rejected, with and without orjson."""
+        with pytest.raises(ValueError, match=ERR_NON_FINITE):
+            EmonRequestCore.dumps_json(value)
+        with patch("emon_tools.emon_api.emon_api_core.orjson", None):
+            with pytest.raises(ValueError, match=ERR_NON_FINITE):
+                EmonRequestCore.dumps_json(value)
+
+    @staticmethod
+    def dumps_json_result(value):
+        """Get dumps_json output, or the raised exception type."""
+        try:
+            return EmonRequestCore.dumps_json(value)
+        except (TypeError, ValueError) as ex:
+            return type(ex)
+
+    @pytest.mark.parametrize("value", JSON_BACKEND_PAYLOADS)
+    def test_dumps_json_backends_agree(self, value, monkeypatch):
+        """Test orjson and simplejson serialize or reject values alike."""
+        with_orjson = self.dumps_json_result(value)
+        monkeypatch.setattr(
+            "emon_tools.emon_api.emon_api_core.orjson", None)
+        assert with_orjson == self.dumps_json_result(value)
+
 
 class TestEmonInputs:
     """Unit tests for EmonInputs class."""
@@ -300,23 +594,11 @@ class TestEmonInputs:
         assert path == expected_path
         assert params is None
 
-    @pytest.mark.parametrize(
-        "node, name, expected_exception",
-        [
-            ("", "Input1", ValueError),
-            ("Node1", "", ValueError),
-            ("", "", ValueError),
-        ],
-    )
-    def test_prep_input_fields_invalid(
-        self,
-        node,
-        name,
-        expected_exception
-    ):
+    def test_prep_input_fields_invalid(self):
         """Test prep_input_fields with invalid input."""
-        with pytest.raises(expected_exception):
-            EmonInputsCore.prep_input_fields(node, name)
+        for node, name, expected_exception in INVALID_INPUT_FIELDS:
+            with pytest.raises(expected_exception):
+                EmonInputsCore.prep_input_fields(node, name)
 
     @pytest.mark.parametrize(
         (
@@ -408,36 +690,13 @@ class TestEmonInputs:
         assert path == "/input/process/set"
         assert params == expected_params
 
-    @pytest.mark.parametrize(
-        "input_id, process_list, expected_exception, error_msg",
-        [
-            (
-                "123", "",
-                ValueError,
-                "Input Id must be an integer."
-            ),
-            (
-                123, None,
-                ValueError,
-                "Invalid data to post inputs."
-            ),
-            (
-                "", "process1:1,process2:2",
-                ValueError,
-                ""
-            ),
-        ],
-    )
-    def test_prep_set_input_process_list_invalid(
-        self,
-        input_id,
-        process_list,
-        expected_exception,
-        error_msg
-    ):
+    def test_prep_set_input_process_list_invalid(self):
         """Test prep_set_input_process_list with invalid input."""
-        with pytest.raises(expected_exception, match=error_msg):
-            EmonInputsCore.prep_set_input_process_list(input_id, process_list)
+        for input_id, process_list, expected_exception, error_msg\
+                in INVALID_INPUT_PROCESS_LISTS:
+            with pytest.raises(expected_exception, match=error_msg):
+                EmonInputsCore.prep_set_input_process_list(
+                    input_id, process_list)
 
     @pytest.mark.parametrize(
         "node, data, expected_params",
@@ -463,107 +722,18 @@ class TestEmonInputs:
         assert path == "/input/post"
         assert params == expected_params
 
-    @pytest.mark.parametrize(
-        "node, data, expected_exception",
-        [
-            ("Node1", {}, ValueError),
-            ("Node1", None, ValueError),
-            ("", {"key1": 1}, TypeError),
-        ],
-    )
-    def test_prep_post_inputs_invalid(
-        self,
-        node,
-        data,
-        expected_exception
-    ):
+    def test_prep_post_inputs_invalid(self):
         """Test prep_post_inputs with invalid input."""
-        with pytest.raises(expected_exception):
-            EmonInputsCore.prep_post_inputs(node, data)
+        for node, data, expected_exception in INVALID_POST_INPUTS:
+            with pytest.raises(expected_exception):
+                EmonInputsCore.prep_post_inputs(node, data)
 
     @pytest.mark.parametrize(
         (
             "params, expected_params, "
             "is_error, expected_error, error_msg"
         ),
-        [
-            (
-                {
-                    "data": ["test"],
-                    "timestamp": None,
-                    "sentat": None,
-                    "offset": None
-                },
-                (
-                    "/input/bulk", {}, {"data": '["test"]'}
-                ),
-                False, None, None
-            ),
-            (
-                {
-                    "data": [],
-                    "timestamp": None,
-                    "sentat": None,
-                    "offset": None
-                },
-                (),
-                True, ValueError, "Invalid data to post inputs."
-            ),
-            (
-                {
-                    "data": {"a": "1"},
-                    "timestamp": None,
-                    "sentat": None,
-                    "offset": None
-                },
-                (),
-                True, ValueError, "Invalid data to post inputs."
-            ),
-            (
-                {
-                    "data": ["test"],
-                    "timestamp": -1,
-                    "sentat": None,
-                    "offset": None
-                },
-                (),
-                True, ValueError,
-                "inputBulkTime timestamp must be a non-negative number."
-            ),
-            (
-                {
-                    "data": ["test"],
-                    "timestamp": None,
-                    "sentat": "-1",
-                    "offset": None
-                },
-                (),
-                True, ValueError,
-                "inputBulkSentat must be an integer."
-            ),
-            (
-                {
-                    "data": ["test"],
-                    "timestamp": None,
-                    "sentat": None,
-                    "offset": "-1"
-                },
-                (),
-                True, ValueError,
-                "inputBulkOffset must be an integer."
-            ),
-            (
-                {
-                    "data": ["test"],
-                    "timestamp": 2,
-                    "sentat": 1,
-                    "offset": 1
-                },
-                (),
-                True, ValueError,
-                r"You must chose an unique format.*"
-            ),
-        ],
+        PREP_INPUT_BULK_CASES
     )
     def test_prep_input_bulk(
         self,
@@ -595,44 +765,11 @@ class TestEmonFeeds:
         """Test the `prep_list_feeds` method for correctness."""
         assert EmonFeedsCore.prep_list_feeds() == ("/feed/list.json", None)
 
-    @pytest.mark.parametrize("feed_id, expected", [
-        (1, ("/feed/aget.json", {"id": 1})),
-        (100, ("/feed/aget.json", {"id": 100})),
-    ])
-    def test_prep_feed_fields(self, feed_id, expected):
-        """Test the `prep_feed_fields` method with valid inputs."""
-        assert EmonFeedsCore.prep_feed_fields(feed_id) == expected
-
-    def test_prep_feed_fields_invalid(self):
-        """Test `prep_feed_fields` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_feed_fields(-1)  # Invalid feed ID
-
-    @pytest.mark.parametrize("feed_id, expected", [
-        (1, ("/feed/getmeta.json", {"id": 1})),
-        (50, ("/feed/getmeta.json", {"id": 50})),
-    ])
-    def test_prep_feed_meta(self, feed_id, expected):
-        """Test the `prep_feed_meta` method with valid inputs."""
-        assert EmonFeedsCore.prep_feed_meta(feed_id) == expected
-
-    def test_prep_feed_meta_invalid(self):
-        """Test `prep_feed_meta` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_feed_meta(0)  # Invalid feed ID
-
-    @pytest.mark.parametrize("feed_id, expected", [
-        (1, ("/feed/timevalue.json", {"id": 1})),
-        (75, ("/feed/timevalue.json", {"id": 75})),
-    ])
-    def test_prep_last_value_feed(self, feed_id, expected):
-        """Test the `prep_last_value_feed` method with valid inputs."""
-        assert EmonFeedsCore.prep_last_value_feed(feed_id) == expected
-
-    def test_prep_last_value_feed_invalid(self):
-        """Test `prep_last_value_feed` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_last_value_feed(-10)  # Invalid feed ID
+    @pytest.mark.parametrize("feed_id", [1, 50, 100])
+    def test_prep_feed_by_id(self, feed_id_method, feed_id):
+        """Test the prep methods taking a feed id with valid inputs."""
+        method, path = feed_id_method
+        assert method(feed_id) == (path, {"id": feed_id})
 
     @pytest.mark.parametrize(
         "feed_id, start, end, interval, average, expected",
@@ -641,35 +778,30 @@ class TestEmonFeeds:
                 1, 1609459200, 1609545600, 60, False,
                 {
                     "id": 1, "start": 1609459200, "end": 1609545600,
-                    "interval": 60, "average": 0, "time_format": "unix",
-                    "skip_missing": 0, "limit_interval": 0, "delta": 0
+                    "interval": 60, "average": 0
                 }
             ),
             (
                 10, 1609459200, 1609545600, 30, True,
                 {
                     "id": 10, "start": 1609459200, "end": 1609545600,
-                    "interval": 30, "average": 1, "time_format": "unix",
-                    "skip_missing": 0, "limit_interval": 0, "delta": 0
+                    "interval": 30, "average": 1
                 }
             ),
-        ]
+        ],
+        ids=["id-1", "id-10-average"]
     )
     def test_prep_fetch_feed_data(
-        self, feed_id, start, end, interval, average, expected
+        self,
+        fetch_feed_common_fields,
+        feed_id, start, end, interval, average, expected
     ):
         """Test the `prep_fetch_feed_data` method with valid parameters."""
         result = EmonFeedsCore.prep_fetch_feed_data(
             feed_id, start, end, interval, average
         )
-        assert result == ("/feed/data.json", expected)
-
-    def test_prep_fetch_feed_data_invalid(self):
-        """Test `prep_fetch_feed_data` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_fetch_feed_data(
-                -1, 1609459200, 1609545600, 60, False
-            )  # Invalid feed ID
+        assert result == (
+            "/feed/data.json", {**fetch_feed_common_fields, **expected})
 
     def test_prep_create_feed(self):
         """Test the `prep_create_feed` method with valid inputs."""
@@ -688,11 +820,6 @@ class TestEmonFeeds:
         )
         assert result == expected
 
-    def test_prep_create_feed_invalid(self):
-        """Test `prep_create_feed` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_create_feed(name="", tag="tag")  # Invalid name
-
     def test_prep_update_feed(self):
         """Test the `prep_update_feed` method with valid inputs."""
         result = EmonFeedsCore.prep_update_feed(
@@ -703,22 +830,11 @@ class TestEmonFeeds:
             "/feed/set.json", {"feed_id": 1, "fields": {"tag": "value"}})
         assert result == expected
 
-    def test_prep_update_feed_invalid(self):
-        """Test `prep_update_feed` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_update_feed(
-                feed_id=1, fields={"name": "@123 /$*ù"})
-
     def test_prep_delete_feed(self):
         """Test the `prep_delete_feed` method with valid inputs."""
         result = EmonFeedsCore.prep_delete_feed(feed_id=1)
         assert result == ("/feed/delete.json", {"id": 1})
 
-    def test_prep_delete_feed_invalid(self):
-        """Test `prep_delete_feed` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_delete_feed(feed_id=-5)  # Invalid feed ID
-
     def test_prep_add_data_point(self):
         """Test the `prep_add_data_point` method with valid inputs."""
         result = EmonFeedsCore.prep_add_data_point(
@@ -729,29 +845,48 @@ class TestEmonFeeds:
         )
         assert result == expected
 
-    def test_prep_add_data_point_invalid(self):
-        """Test `prep_add_data_point` method with invalid inputs."""
-        with pytest.raises(ValueError):
-            EmonFeedsCore.prep_add_data_point(
-                feed_id=1, time=1609459200, value="abc")  # Invalid value
-
     def test_prep_add_data_points(self):
         """Test the `prep_add_data_points` method with valid inputs."""
         result = EmonFeedsCore.prep_add_data_points(
             feed_id=1,
-            data=[[1609459200, 123.45], [1609545600, 678.90]]
+            data=SAMPLE_POINTS
         )
         expected = (
             "/feed/insert.json",
             {
                 "feed_id": 1,
-                "data": [[1609459200, 123.45], [1609545600, 678.90]]
+                "data": SAMPLE_POINTS
             }
         )
         assert result == expected
 
-    def test_prep_add_data_points_invalid(self):
-        """Test `prep_add_data_points` method with invalid inputs."""
+    def test_prep_add_data_points_array(self):
+        """Test `prep_add_data_points` with a NumPy data points array."""
+        result = EmonFeedsCore.prep_add_data_points(
+            feed_id=1,
+            data=np.array(SAMPLE_POINTS)
+        )
+        data = result[1]["data"]
+        assert data == [list(point) for point in SAMPLE_POINTS]
+        assert all(isinstance(time, int) for time, _ in data)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            np.array([1609459200, 1609545600]),
+            np.array([[1609459200, 123.45, 1.0]]),
+            np.array([[1609459200.5, 123.45]]),
+            np.array([[np.nan, 123.45]]),
+        ],
+        ids=["one-dim", "three-columns", "float-time", "nan-time"]
+    )
+    def test_prep_add_data_points_array_invalid(self, data):
+        """Test `prep_add_data_points` with invalid data points arrays."""
+        with pytest.raises(ValueError):
+            EmonFeedsCore.prep_add_data_points(feed_id=1, data=data)
+
+    @pytest.mark.parametrize("method, args, kwargs", INVALID_FEEDS_CASES)
+    def test_prep_methods_invalid(self, method, args, kwargs):
+        """Test the EmonFeeds prep methods with invalid inputs."""
         with pytest.raises(ValueError):
-            EmonFeedsCore.prep_add_data_points(
-                feed_id=1, data=[[1609459200, "abc"]])
+            method(*args, **kwargs)
@@ -1,41 +1,66 @@
 """Emon Fina shared data test"""
+from functools import lru_cache
+from types import MappingProxyType
+from emon_tools.emon_fina.fina_services import FinaMeta
 from emon_tools.emon_fina.fina_utils import Utils as Ut
 
 
 class EmonFinaDataTest:
-    """Emon Fina shared data test"""
+    """
+    Emon Fina shared data test
+
+    Values are computed once and cached, shared by the fina test modules.
+    Meta mappings are read-only, and meta models must not be mutated
+    by callers.
+    """
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_time_start():
         """Get finaMeta data"""
         return int(Ut.get_start_day(1575981140))
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_time_start_2():
         """Get finaMeta data"""
-        return int(Ut.get_start_day(1575981140)) - 33
+        return EmonFinaDataTest.get_time_start() - 33
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_fina_meta():
         """Get finaMeta data"""
         npoints = 3600 * 24 * 6
         start_time = EmonFinaDataTest.get_time_start()
-        return {
+        return MappingProxyType({
             "start_time": start_time,
             "interval": 10,
             "npoints": npoints,
             "end_time": start_time + npoints * 10 - 10,
             "size": npoints * 4
-        }
+        })
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_fina_meta_slim():
         """Get finaMeta data"""
         npoints = 360
         start_time = EmonFinaDataTest.get_time_start_2()
-        return {
+        return MappingProxyType({
             "start_time": start_time,
             "interval": 10,
             "npoints": npoints,
             "end_time": start_time + npoints * 10 - 10,
             "size": npoints * 4
-        }
\ No newline at end of file
+        })
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_fina_meta_model():
+        """Get validated finaMeta model"""
+        return FinaMeta(**EmonFinaDataTest.get_fina_meta())
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_fina_meta_slim_model():
+        """Get validated slim finaMeta model"""
+        return FinaMeta(**EmonFinaDataTest.get_fina_meta_slim())
@@ -0,0 +1,37 @@
+"""
+Lightweight FinaReader stub for FinaData tests.
+"""
+from typing import Any
+from typing import Optional
+
+
+class FinaReaderStub:
+    """
+    Minimal MagicMock replacement for FinaReader.
+
+    `read_meta` returns `meta`, `read_file` returns `chunks`
+    and `initialise_reader` does nothing, reader `props`
+    being set by tests, without MagicMock call tracking overhead.
+    """
+    __slots__ = ("meta", "chunks", "props")
+
+    def __init__(
+        self,
+        meta: Optional[Any] = None,
+        chunks: Optional[list] = None,
+        props: Optional[Any] = None
+    ):
+        self.meta = meta
+        self.chunks = chunks or []
+        self.props = props
+
+    def read_meta(self) -> Any:
+        """Get stub meta."""
+        return self.meta
+
+    def initialise_reader(self, *args, **kwargs) -> None:
+        """Keep reader props as set by tests."""
+
+    def read_file(self) -> list:
+        """Get stub data chunks."""
+        return self.chunks
@@ -1,6 +1,5 @@
 """FinaData Unit Tests"""
 # pylint: disable=unused-argument,protected-access
-from unittest.mock import MagicMock
 from unittest.mock import patch, mock_open
 from struct import pack
 import datetime as dt
@@ -16,6 +15,117 @@ from emon_tools.emon_fina.fina_models import TimeRefEnum
 from emon_tools.emon_fina.fina_services import FileReaderProps, FinaMeta
 from emon_tools.emon_fina.fina_utils import Utils
 from tests.emon_fina.fina_data_test import EmonFinaDataTest
+from tests.emon_fina.reader_stub import FinaReaderStub
+
+# Fina meta file content: legacy fields, interval and start time
+META_BYTES = pack("<4I", 0, 0, 10, 1575981140)
+# Search start times, resolved once
+TIME_START = EmonFinaDataTest.get_time_start()
+TIME_START_2 = EmonFinaDataTest.get_time_start_2()
+# Validated fina metas, shared read-only
+FINA_META = EmonFinaDataTest.get_fina_meta_model()
+FINA_META_SLIM = EmonFinaDataTest.get_fina_meta_slim_model()
+# Mocked read_file data, float32 values as read from fina files,
+# shared read-only, see mock_chunk
+BASE_POSITIONS = np.arange(0, 4096, 1)
+BASE_POSITIONS.setflags(write=False)
+BASE_VALUES = np.arange(20, 20 + 4096, dtype=np.float32)
+BASE_VALUES.setflags(write=False)
+# Averaged output shape by output type, for a 3600s window at 60s
+OUTPUT_TYPE_SHAPES = (
+    (OutputType.VALUES, (60, 1)),
+    (OutputType.VALUES_MIN_MAX, (60, 3)),
+    (OutputType.TIME_SERIES, (60, 2)),
+    (OutputType.TIME_SERIES_MIN_MAX, (60, 4)),
+    (OutputType.INTEGRITY, (60, 3)),
+)
+
+
+def make_reader_props(
+    meta: FinaMeta,
+    search: FinaByTimeParamsModel
+) -> FileReaderProps:
+    """
+    Get new initialised reader props for a meta and a search.
+
+    `initialise_reader` aligns the given search in place.
+    """
+    reader_props = FileReaderProps(meta=meta, search=search)
+    reader_props.initialise_reader()
+    return reader_props
+
+
+def mock_chunk(npoints: int = 360) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Get mocked read_file data of npoints positions and values.
+
+    Arrays are zero-copy views of the shared read-only base arrays.
+    """
+    return [(BASE_POSITIONS[:npoints], BASE_VALUES[:npoints])]
+
+
+def by_time_search(kwargs: dict) -> FinaByTimeParamsModel:
+    """Get a by time search from search kwargs."""
+    return FinaByTimeParamsModel(**kwargs)
+
+
+def by_date_search(kwargs: dict) -> FinaByDateParamsModel:
+    """Get a by date search from by time search kwargs."""
+    start, _ = Utils.get_dates_interval_from_timestamp(
+        start=kwargs['start_time'],
+        window=kwargs['time_window']
+    )
+    return FinaByDateParamsModel(
+        start_date=start,
+        time_window=kwargs['time_window'],
+        time_interval=kwargs['time_interval']
+    )
+
+
+def by_date_range_search(kwargs: dict) -> FinaByDateRangeParamsModel:
+    """Get a by date range search from by time search kwargs."""
+    start, end = Utils.get_dates_interval_from_timestamp(
+        start=kwargs['start_time'],
+        window=kwargs['time_window']
+    )
+    return FinaByDateRangeParamsModel(
+        start_date=start,
+        end_date=end,
+        time_interval=kwargs['time_interval']
+    )
+
+
+# FinaData methods reading data values, with their search builder
+FINA_VALUES_METHODS = (
+    pytest.param("read_fina_values", by_time_search, id="read_fina_values"),
+    pytest.param("get_fina_values", by_time_search, id="get_fina_values"),
+    pytest.param("get_data_by_date", by_date_search, id="get_data_by_date"),
+    pytest.param(
+        "get_data_by_date_range", by_date_range_search,
+        id="get_data_by_date_range"
+    ),
+)
+# Data values search kwargs, with expected number of values
+FINA_VALUES_CASES = (
+    pytest.param(
+        {
+            "start_time": TIME_START_2,
+            "time_window": 3600,
+            "time_interval": 10
+        },
+        359,
+        id="interval-10"
+    ),
+    pytest.param(
+        {
+            "start_time": TIME_START_2,
+            "time_window": 3600,
+            "time_interval": 20
+        },
+        179,
+        id="interval-20"
+    ),
+)
 
 
 class TestFinaData:
@@ -37,16 +147,21 @@ class TestFinaData:
         return str(data_dir)
 
     @pytest.fixture
-    @patch("builtins.open",
-           new_callable=mock_open,
-           read_data=pack("<2I", 10, 1575981140))
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=400)
-    def fdt(self,
-            mock_open_file,
-            mock_isfile,
-            mock_getsize,
-            tmp_path_override):
+    def meta_file(self):
+        """
+        Fixture to mock a valid fina meta file on disk.
+        """
+        with patch("builtins.open",
+                   new_callable=mock_open,
+                   read_data=META_BYTES), \
+                patch("emon_tools.emon_fina.fina_reader.isfile",
+                      return_value=True), \
+                patch("emon_tools.emon_fina.fina_reader.getsize",
+                      return_value=400):
+            yield
+
+    @pytest.fixture
+    def fdt(self, meta_file, tmp_path_override):
         """
         Fixture to provide a valid FinaData instance for testing.
         """
@@ -57,58 +172,48 @@ class TestFinaData:
         )
 
     @pytest.fixture
+    def patch_reader(self, monkeypatch):
+        """
+        Fixture to make FinaData use a mocked FinaReader.
+
+        The patch is undone at the end of each test.
+        """
+        def _patch_reader(mock_reader):
+            monkeypatch.setattr(
+                "emon_tools.emon_fina.emon_fina.FinaReader",
+                lambda *args, **kwargs: mock_reader
+            )
+        return _patch_reader
+
+    @pytest.fixture(scope="module")
     def mock_reader_base(self):
-        """Fixture to mock the FinaReader."""
-        mock_reader = MagicMock()
+        """
+        Fixture to mock the FinaReader.
+
+        Mock readers are shared by the module tests,
+        each test sets the reader props and read_file data it needs.
+        """
+        mock_reader = FinaReaderStub()
         # Two days of data at 10-second intervals
         return mock_reader
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_reader_meta(self):
         """Fixture to mock the FinaReader."""
-        mock_reader = MagicMock()
+        mock_reader = FinaReaderStub()
         # Two days of data at 10-second intervals
-        mock_reader.read_meta.return_value = FinaMeta(
-            **EmonFinaDataTest.get_fina_meta()
-        )
-        mock_reader.DEFAULT_CHUNK_SIZE = 1024
-        mock_reader.CHUNK_SIZE_LIMIT = 4096
+        mock_reader.meta = FINA_META
         return mock_reader
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_reader(self):
         """Fixture to mock the FinaReader."""
-        mock_reader = MagicMock()
+        mock_reader = FinaReaderStub()
         # Two days of data at 10-second intervals
-        mock_reader.read_meta.return_value = FinaMeta(
-            **EmonFinaDataTest.get_fina_meta()
-        )
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta()
-            ),
-            search=FinaByTimeParamsModel(
-                start_time=EmonFinaDataTest.get_time_start(),
-                time_interval=10,
-                time_window=3600
-            )
-        )
-        reader_props.initialise_reader()
-        mock_reader.props = reader_props
-        mock_reader.DEFAULT_CHUNK_SIZE = 1024
-        mock_reader.CHUNK_SIZE_LIMIT = 4096
+        mock_reader.meta = FINA_META
         return mock_reader
 
-    @patch("builtins.open",
-           new_callable=mock_open,
-           read_data=pack("<2I", 10, 1575981140))
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=400)
-    def test_initialization_valid(self,
-                                  mock_open_file,
-                                  mock_isfile,
-                                  mock_getsize,
-                                  tmp_path_override):
+    def test_initialization_valid(self, meta_file, tmp_path_override):
         """
         Test initializing FinaData with valid parameters.
         """
@@ -139,7 +244,7 @@ class TestFinaData:
         [
             (
                 {
-                    "start_time": int(Utils.get_start_day(1575981140)),
+                    "start_time": TIME_START,
                     "time_window": 3600,
                     "time_interval": 60
                 },
@@ -147,7 +252,7 @@ class TestFinaData:
             ),
             (
                 {
-                    "start_time": int(Utils.get_start_day(1575981140)),
+                    "start_time": TIME_START,
                     "time_window": 3600,
                     "time_interval": 30
                 },
@@ -157,6 +262,7 @@ class TestFinaData:
     )
     def test_get_averaged_values(
         self,
+        patch_reader,
         kwargs,
         expected,
         mock_reader_meta
@@ -165,26 +271,9 @@ class TestFinaData:
         Test FinaData _get_averaged_values method.
         """
         search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
+        mock_reader_meta.chunks = mock_chunk()
+        mock_reader_meta.props = make_reader_props(FINA_META, search)
+        patch_reader(mock_reader_meta)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
         result = fdtm._get_averaged_values(search)
         assert result.shape[0] == expected
@@ -194,7 +283,7 @@ class TestFinaData:
         [
             (
                 {
-                    "start_time": int(Utils.get_start_day(1575981140)),
+                    "start_time": TIME_START,
                     "time_window": 3600,
                     "time_interval": 10
                 },
@@ -202,7 +291,7 @@ class TestFinaData:
             ),
             (
                 {
-                    "start_time": int(Utils.get_start_day(1575981140)),
+                    "start_time": TIME_START,
                     "time_window": 100,
                     "time_interval": 10
                 },
@@ -212,6 +301,7 @@ class TestFinaData:
     )
     def test_read_direct_values_no_remaining(
         self,
+        patch_reader,
         kwargs,
         expected,
         mock_reader_meta
@@ -220,26 +310,9 @@ class TestFinaData:
         Test _read_direct_values when remaining points become zero.
         """
         search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
+        mock_reader_meta.chunks = mock_chunk()
+        mock_reader_meta.props = make_reader_props(FINA_META, search)
+        patch_reader(mock_reader_meta)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
         result = fdtm._read_direct_values(search)
         assert result.shape[0] == expected
@@ -249,7 +322,7 @@ class TestFinaData:
         [
             (
                 {
-                    "start_time": int(Utils.get_start_day(1575981140)),
+                    "start_time": TIME_START,
                     "time_window": 3600,
                     "time_interval": 60
                 },
@@ -259,6 +332,7 @@ class TestFinaData:
     )
     def test_get_averaged_values_empty_values(
         self,
+        patch_reader,
         kwargs,
         expected,
         mock_reader_meta
@@ -268,122 +342,52 @@ class TestFinaData:
         """
         # start, step, npts, interval, window = 0, 20, 3, 10, 60
         search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
+        mock_reader_meta.chunks = [
             (
-                np.arange(0, 360, 1),  # Positions
-                np.full((360, 1), np.nan, dtype=float),  # Values
+                BASE_POSITIONS[:360],
+                np.full(360, np.nan, dtype=np.float32),  # Values
             )
         ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
+        mock_reader_meta.props = make_reader_props(FINA_META, search)
+        patch_reader(mock_reader_meta)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
         result = fdtm._get_averaged_values(search)
         assert result.shape[0] == expected
+        assert result.flags['C_CONTIGUOUS']
         assert np.isnan(result[:, 1]).size == expected
 
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": int(Utils.get_start_day(1575981140)),
-                    "time_window": 3600,
-                    "time_interval": 60,
-                    "output_type": OutputType.VALUES
-                },
-                (60, 1)
-            ),
-            (
-                {
-                    "start_time": int(Utils.get_start_day(1575981140)),
-                    "time_window": 3600,
-                    "time_interval": 60,
-                    "output_type": OutputType.VALUES_MIN_MAX
-                },
-                (60, 3)
-            ),
-            (
-                {
-                    "start_time": int(Utils.get_start_day(1575981140)),
-                    "time_window": 3600,
-                    "time_interval": 60,
-                    "output_type": OutputType.TIME_SERIES
-                },
-                (60, 2)
-            ),
-            (
-                {
-                    "start_time": int(Utils.get_start_day(1575981140)),
-                    "time_window": 3600,
-                    "time_interval": 60,
-                    "output_type": OutputType.TIME_SERIES_MIN_MAX
-                },
-                (60, 4)
-            ),
-            (
-                {
-                    "start_time": int(Utils.get_start_day(1575981140)),
-                    "time_window": 3600,
-                    "time_interval": 60,
-                    "output_type": OutputType.INTEGRITY
-                },
-                (60, 3)
-            ),
-        ],
-    )
     def test_get_averaged_output_type(
         self,
-        kwargs,
-        expected,
+        patch_reader,
         mock_reader_meta
     ):
         """
-        Test _read_averaged_values when remaining points become zero.
+        Test _get_averaged_values output shape for each output type.
+
+        FinaData is built once,
+        then each output type is averaged in turn.
         """
-        # start, step, npts, interval, window = 0, 20, 2, 10, 40
-        search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
+        base_search = FinaByTimeParamsModel(
+            start_time=TIME_START,
+            time_window=3600,
+            time_interval=60
         )
+        mock_reader_meta.chunks = mock_chunk()
+        patch_reader(mock_reader_meta)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
-        result = fdtm._get_averaged_values(search)
-        assert result.shape == expected
+        for output_type, expected in OUTPUT_TYPE_SHAPES:
+            search = base_search.model_copy(
+                update={"output_type": output_type})
+            mock_reader_meta.props = make_reader_props(FINA_META, search)
+            result = fdtm._get_averaged_values(search)
+            assert result.shape == expected, output_type
 
     @pytest.mark.parametrize(
         "kwargs, expected",
         [
             (  # 0
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
+                    "start_time": TIME_START_2,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.COMPLETE,
@@ -393,7 +397,7 @@ class TestFinaData:
             ),
             (  # 1
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
+                    "start_time": TIME_START_2,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.COMPLETE,
@@ -403,7 +407,7 @@ class TestFinaData:
             ),
             (  # 2
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.COMPLETE,
@@ -413,7 +417,7 @@ class TestFinaData:
             ),
             (  # 3
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.COMPLETE,
@@ -423,7 +427,7 @@ class TestFinaData:
             ),
             (  # 4
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 120,
+                    "start_time": TIME_START_2 - 120,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.COMPLETE,
@@ -433,7 +437,7 @@ class TestFinaData:
             ),
             (  # 5
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.PARTIAL,
@@ -443,7 +447,7 @@ class TestFinaData:
             ),
             (  # 6
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.PARTIAL,
@@ -453,7 +457,7 @@ class TestFinaData:
             ),
             (  # 7
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.AS_IS,
@@ -463,7 +467,7 @@ class TestFinaData:
             ),
             (  # 8
                 {
-                    "start_time": EmonFinaDataTest.get_time_start_2() - 142,
+                    "start_time": TIME_START_2 - 142,
                     "time_window": 3600,
                     "time_interval": 60,
                     "output_average": OutputAverageEnum.AS_IS,
@@ -475,6 +479,7 @@ class TestFinaData:
     )
     def test_get_averaged_values_output_average(
         self,
+        patch_reader,
         kwargs,
         expected,
         mock_reader_base
@@ -484,30 +489,11 @@ class TestFinaData:
         """
         # start, step, npts, interval, window = 0, 20, 3, 10, 60
         search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_base.read_meta.return_value = FinaMeta(
-            **EmonFinaDataTest.get_fina_meta_slim()
-        )
+        mock_reader_base.meta = FINA_META_SLIM
 
-        mock_reader_base.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_base.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_base
-        )
+        mock_reader_base.chunks = mock_chunk()
+        mock_reader_base.props = make_reader_props(FINA_META_SLIM, search)
+        patch_reader(mock_reader_base)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
         result = fdtm._get_averaged_values(search)
         assert result.shape[0] == expected
@@ -522,7 +508,7 @@ class TestFinaData:
                     "time_interval": 60,
                     "time_ref_start": TimeRefEnum.BY_TIME
                 },
-                (60, [1575936010.0, 1575936070.0, 1575936130.0])
+                (60, np.array([1575936010.0, 1575936070.0, 1575936130.0]))
             ),
             (
                 {
@@ -531,12 +517,13 @@ class TestFinaData:
                     "time_interval": 60,
                     "time_ref_start": TimeRefEnum.BY_SEARCH
                 },
-                (60, [1575936010.0, 1575936070.0, 1575936130.0])
+                (60, np.array([1575936010.0, 1575936070.0, 1575936130.0]))
             ),
         ],
     )
     def test_get_averaged_values_time_ref_start(
         self,
+        patch_reader,
         kwargs,
         expected,
         mock_reader
@@ -545,24 +532,13 @@ class TestFinaData:
         Test _read_averaged_values when reshaped_values is empty.
         """
         search = FinaByTimeParamsModel(**kwargs)
-        mock_reader.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        mock_reader.props.search = search
-        mock_reader.props.initialise_reader()
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader
-        )
+        mock_reader.chunks = mock_chunk()
+        mock_reader.props = make_reader_props(FINA_META, search)
+        patch_reader(mock_reader)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
         result = fdtm._get_averaged_values(search)
         assert result.shape[0] == expected[0]
-        assert result[0: 3, 0].tolist() == expected[1]
+        np.testing.assert_array_equal(result[:3, 0], expected[1])
 
     def test_reset(self, fdt):
         """Test the reset method for FinaData."""
@@ -595,10 +571,8 @@ class TestFinaData:
         fdt.lines = 10
         ts = fdt.timescale()
         assert isinstance(ts, np.ndarray)
-        assert len(ts) == 10
-        assert ts.min() == 0
-        assert ts.max() == 90
-        assert ts.mean() == 45
+        np.testing.assert_array_equal(
+            ts, np.arange(0, 100, 10, dtype=ts.dtype))
 
     def test_timestamps(self, fdt):
         """
@@ -613,256 +587,37 @@ class TestFinaData:
         fdt.start = 1700000000
         ts = fdt.timestamps()
         assert isinstance(ts, np.ndarray)
-        assert len(ts) == 10
-        assert ts.min() == 1700000000
-        assert ts.max() == 1700000090
-        assert ts.mean() == 1700000045
+        np.testing.assert_array_equal(
+            ts, 1700000000 + np.arange(0, 100, 10, dtype=ts.dtype))
 
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 10
-                },
-                359
-            ),
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 20
-                },
-                179
-            ),
-        ],
-    )
-    def test_read_fina_values(
+    @pytest.mark.parametrize("method_name, make_search", FINA_VALUES_METHODS)
+    @pytest.mark.parametrize("kwargs, expected", FINA_VALUES_CASES)
+    def test_fina_values_methods(
         self,
+        patch_reader,
+        method_name,
+        make_search,
         kwargs,
         expected,
         mock_reader_meta
     ):
         """
-        Test the read_fina_values method for reading raw data values.
-        """
-        search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
-        fdtm = FinaData(file_name="1", data_dir="mock_dir")
-        # Run the read_file method
-        data = fdtm.read_fina_values(search)
-
-        assert data.shape[0] == expected
+        Test the FinaData methods reading data values.
 
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 10
-                },
-                359
-            ),
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 20
-                },
-                179
-            ),
-        ],
-    )
-    def test_get_fina_values(
-        self,
-        kwargs,
-        expected,
-        mock_reader_meta
-    ):
-        """
-        Test get_fina_values method.
+        Each method reads the same search window,
+        converted to the search model it takes.
         """
-        search = FinaByTimeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
-            search=search
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
-        fdtm = FinaData(file_name="1", data_dir="mock_dir")
-        # Run the read_file method
-        data = fdtm.get_fina_values(search)
-
-        assert data.shape[0] == expected
-
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 10
-                },
-                359
-            ),
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 20
-                },
-                179
-            ),
-        ],
-    )
-    def test_get_data_by_date(
-        self,
-        kwargs,
-        expected,
-        mock_reader_meta
-    ):
-        """
-        Test get_fina_values_by_date method.
-        """
-        start, _ = Utils.get_dates_interval_from_timestamp(
-            start=kwargs.get('start_time'),
-            window=kwargs.get('time_window')
-        )
         search_t = FinaByTimeParamsModel(**kwargs)
-        del kwargs['start_time']
-        kwargs['start_date'] = start
-        search = FinaByDateParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
-            search=search_t
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
+        mock_reader_meta.chunks = mock_chunk()
+        mock_reader_meta.props = make_reader_props(FINA_META_SLIM, search_t)
+        patch_reader(mock_reader_meta)
         fdtm = FinaData(file_name="1", data_dir="mock_dir")
 
-        data = fdtm.get_data_by_date(search)
+        data = getattr(fdtm, method_name)(make_search(kwargs))
 
         assert isinstance(data, np.ndarray)
         assert data.shape[0] == expected
 
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 10
-                },
-                359
-            ),
-            (
-                {
-                    "start_time": EmonFinaDataTest.get_time_start_2(),
-                    "time_window": 3600,
-                    "time_interval": 20
-                },
-                179
-            ),
-        ],
-    )
-    def test_get_data_by_date_range(
-        self,
-        kwargs,
-        expected,
-        mock_reader_meta
-    ):
-        """
-        Test get_data_by_date_range method.
-        """
-        # Run the read_file method
-        start, end = Utils.get_dates_interval_from_timestamp(
-            start=kwargs.get('start_time'),
-            window=kwargs.get('time_window')
-        )
-        search_t = FinaByTimeParamsModel(**kwargs)
-        del kwargs['start_time']
-        del kwargs['time_window']
-        kwargs['start_date'] = start
-        kwargs['end_date'] = end
-        search = FinaByDateRangeParamsModel(**kwargs)
-        mock_reader_meta.read_file.return_value = [
-            (
-                np.arange(0, 360, 1),  # Positions
-                np.arange(20, 20 + 360, dtype=float),  # Values
-            )
-        ]  # Mocked data
-        reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
-            search=search_t
-        )
-        reader_props.initialise_reader()
-        mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.setattr(
-            "emon_tools.emon_fina.emon_fina.FinaReader",
-            lambda *args,
-            **kwargs: mock_reader_meta
-        )
-        fdtm = FinaData(file_name="1", data_dir="mock_dir")
-        data = fdtm.get_data_by_date_range(search)
-
-        assert data.shape[0] == expected
-
     @pytest.mark.parametrize(
         "dt_value, date_format, expected",
         [
@@ -888,6 +643,18 @@ class TestFinaData:
         )
         assert result == expected
 
+    def test_get_utc_datetime_from_string_cached(self):
+        """Test get_utc_datetime_from_string results are cached."""
+        hits = Utils._parse_datetime_string.cache_info().hits
+        for _ in range(2):
+            result = Utils.get_utc_datetime_from_string(
+                dt_value="2024-12-15 08:00:00",
+                timezone=dt.timezone.utc
+            )
+        assert result == dt.datetime(
+            2024, 12, 15, 8, 0, tzinfo=dt.timezone.utc)
+        assert Utils._parse_datetime_string.cache_info().hits > hits
+
     @pytest.mark.parametrize(
         "dt_value, date_format, expected_exception, error_msg",
         [
@@ -951,6 +718,14 @@ class TestFinaData:
         # Assert
         assert result == expected
 
+    def test_get_dates_interval_from_timestamp_cached(self):
+        """Test get_dates_interval_from_timestamp results are cached."""
+        hits = Utils._format_dates_interval.cache_info().hits
+        for _ in range(2):
+            result = Utils.get_dates_interval_from_timestamp(86400, 60)
+        assert result == ("1970-01-02 00:00:00", "1970-01-02 00:01:00")
+        assert Utils._format_dates_interval.cache_info().hits > hits
+
     @pytest.mark.parametrize(
         "start, window, expected_exception, error_msg",
         [
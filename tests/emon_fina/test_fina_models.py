@@ -1,4 +1,5 @@
 """Fina Models Unit Tests"""
+import re
 from pydantic import ValidationError
 import pytest
 from emon_tools.emon_fina.fina_models import OutputType
@@ -8,6 +9,260 @@ from emon_tools.emon_fina.fina_models import FinaMetaModel
 from emon_tools.emon_fina.fina_models import FileReaderPropsModel
 from emon_tools.emon_fina.fina_models import FinaByTimeParamsModel
 
+ERR_BY_TIME_3 = re.compile(
+    r"3 validation errors for FinaByTimeParamsModel\n.*")
+ERR_BY_TIME_7 = re.compile(
+    r"7 validation errors for FinaByTimeParamsModel\n.*")
+ERR_META_4 = re.compile(r"4 validation errors for FinaMetaModel\n.*")
+ERR_META_5 = re.compile(r"5 validation errors for FinaMetaModel\n.*")
+ERR_META_TIMES = re.compile(r"start_time must be less than end_time\.")
+ERR_PROPS_19 = re.compile(
+    r"19 validation errors for FileReaderPropsModel\n.*")
+# FinaByTimeParamsModel default values, added to valid search dumps
+SEARCH_DEFAULTS = {
+    'n_decimals': 3,
+    'min_value': None,
+    'max_value': None,
+    'output_average': OutputAverageEnum.COMPLETE,
+    'time_ref_start': TimeRefEnum.BY_TIME
+}
+BY_TIME_VALID_CASES = (
+    pytest.param(
+        (
+            {
+                "start_time": 1700000009,
+                "time_window": 3600,
+                "time_interval": 10,
+                "output_type": OutputType.VALUES
+            },
+            {
+                'start_time': 1700000009,
+                'time_window': 3600,
+                'time_interval': 10,
+                'n_decimals': 3,
+                'min_value': None, 'max_value': None,
+                'output_type': OutputType.VALUES,
+                'output_average': OutputAverageEnum.COMPLETE,
+                'time_ref_start': TimeRefEnum.BY_TIME
+            }
+        ),
+        id="values"
+    ),
+    pytest.param(
+        (
+            {
+                "start_time": 1700000009,
+                "time_window": 3600,
+                "time_interval": 10,
+                'min_value': -50,
+                'max_value': 50,
+                "output_type": OutputType.VALUES
+            },
+            {
+                'start_time': 1700000009,
+                'time_window': 3600,
+                'time_interval': 10,
+                'n_decimals': 3,
+                'min_value': -50, 'max_value': 50,
+                'output_type': OutputType.VALUES,
+                'output_average': OutputAverageEnum.COMPLETE,
+                'time_ref_start': TimeRefEnum.BY_TIME
+            }
+        ),
+        id="int-limits"
+    ),
+    pytest.param(
+        (
+            {
+                "start_time": 1700000009,
+                "time_window": 3600,
+                "time_interval": 10,
+                'min_value': -50.5,
+                'max_value': 50.5,
+                "output_type": OutputType.VALUES
+            },
+            {
+                "start_time": 1700000009,
+                "time_window": 3600,
+                'time_interval': 10,
+                'n_decimals': 3,
+                'min_value': -50.5, 'max_value': 50.5,
+                'output_type': OutputType.VALUES,
+                'output_average': OutputAverageEnum.COMPLETE,
+                'time_ref_start': TimeRefEnum.BY_TIME
+            }
+        ),
+        id="float-limits"
+    ),
+    pytest.param(
+        (
+            {
+                "start_time": 0,
+                "time_window": 0,
+                "time_interval": 0,
+                "output_type": OutputType.VALUES
+            },
+            {
+                "start_time": 0,
+                "time_window": 0,
+                'time_interval': 0,
+                'n_decimals': 3,
+                'min_value': None, 'max_value': None,
+                'output_type': OutputType.VALUES,
+                'output_average': OutputAverageEnum.COMPLETE,
+                'time_ref_start': TimeRefEnum.BY_TIME
+            }
+        ),
+        id="zero"
+    ),
+    pytest.param(
+        (
+            {},
+            {
+                "start_time": 0,
+                "time_window": 0,
+                'time_interval': 0,
+                'n_decimals': 3,
+                'min_value': None, 'max_value': None,
+                'output_type': OutputType.TIME_SERIES,
+                'output_average': OutputAverageEnum.COMPLETE,
+                'time_ref_start': TimeRefEnum.BY_TIME
+            }
+        ),
+        id="defaults"
+    ),
+)
+META_VALID_CASES = (
+    pytest.param(
+        {
+            "interval": 10,
+            "start_time": 1700000009,
+            "end_time": 1700003609,
+            "npoints": 100,
+            "size": 4096
+        },
+        id="meta"
+    ),
+    pytest.param(
+        {
+            "interval": 0,
+            "start_time": 0,
+            "end_time": 0,
+            "npoints": 0,
+            "size": 0
+        },
+        id="zero"
+    ),
+)
+# FileReaderPropsModel nested inputs, shared by valid cases
+PROPS_META = {
+    "interval": 10,
+    "start_time": 1700000009,
+    "end_time": 1700003609,
+    "npoints": 100,
+    "size": 4096
+}
+PROPS_META_ZERO = {
+    "interval": 0,
+    "start_time": 0,
+    "end_time": 0,
+    "npoints": 0,
+    "size": 0
+}
+PROPS_SEARCH = {
+    "start_time": 1700000009,
+    "time_window": 3600,
+    "time_interval": 10,
+    "output_type": OutputType.VALUES
+}
+PROPS_SEARCH_ZERO = {
+    "start_time": 0,
+    "time_window": 0,
+    "time_interval": 0,
+    "output_type": OutputType.VALUES
+}
+# FileReaderPropsModel reading state, without chunk_size
+PROPS_STATE = {
+    "current_pos": 0,
+    "start_pos": 0,
+    "remaining_points": 0,
+    "start_search": 0,
+    "window_search": 0,
+    "block_size": 0,
+    "current_window": 0,
+    "window_max": 0,
+    "current_start": 0,
+    "next_start": 0,
+    "auto_pos": True
+}
+PROPS_VALID_CASES = (
+    pytest.param(
+        (
+            {
+                "meta": PROPS_META_ZERO,
+                "search": PROPS_SEARCH_ZERO,
+                "chunk_size": 0,
+                **PROPS_STATE
+            },
+            {
+                "meta": PROPS_META_ZERO,
+                "search": {**PROPS_SEARCH_ZERO, **SEARCH_DEFAULTS},
+                "chunk_size": 0,
+                **PROPS_STATE
+            }
+        ),
+        id="zero"
+    ),
+)
+# Trusted cases, built without validation from nested model instances
+PROPS_TRUSTED_CASES = (
+    pytest.param(
+        (
+            {
+                "meta": FinaMetaModel.model_construct(**PROPS_META),
+                "search": FinaByTimeParamsModel.model_construct(
+                    **PROPS_SEARCH),
+                "chunk_size": 1024,
+                **PROPS_STATE
+            },
+            {
+                "meta": PROPS_META,
+                "search": {**PROPS_SEARCH, **SEARCH_DEFAULTS},
+                "chunk_size": 1024,
+                **PROPS_STATE
+            }
+        ),
+        id="props"
+    ),
+)
+
+
+@pytest.fixture(scope="module", params=BY_TIME_VALID_CASES)
+def by_time_params_case(request):
+    """Valid FinaByTimeParamsModel and expected values, built once."""
+    kwargs, expected = request.param
+    return FinaByTimeParamsModel(**kwargs), expected
+
+
+@pytest.fixture(scope="module", params=META_VALID_CASES)
+def meta_case(request):
+    """Valid FinaMetaModel and expected values, built once."""
+    return FinaMetaModel(**request.param), request.param
+
+
+@pytest.fixture(scope="module", params=PROPS_VALID_CASES)
+def reader_props_case(request):
+    """Valid FileReaderPropsModel and expected dump, built once."""
+    kwargs, expected = request.param
+    return FileReaderPropsModel(**kwargs), expected
+
+
+@pytest.fixture(scope="module", params=PROPS_TRUSTED_CASES)
+def trusted_reader_props_case(request):
+    """Trusted FileReaderPropsModel and expected dump, built once."""
+    kwargs, expected = request.param
+    return FileReaderPropsModel.model_construct(**kwargs), expected
+
 
 class TestFinaByTimeParamsModel:
     """
@@ -15,109 +270,11 @@ class TestFinaByTimeParamsModel:
 
     This test suite validates the functionality of FinaData Models Validators
     """
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "start_time": 1700000009,
-                    "time_window": 3600,
-                    "time_interval": 10,
-                    "output_type": OutputType.VALUES
-                },
-                {
-                    'start_time': 1700000009,
-                    'time_window': 3600,
-                    'time_interval': 10,
-                    'n_decimals': 3,
-                    'min_value': None, 'max_value': None,
-                    'output_type': OutputType.VALUES,
-                    'output_average': OutputAverageEnum.COMPLETE,
-                    'time_ref_start': TimeRefEnum.BY_TIME
-                }
-            ),
-            (
-                {
-                    "start_time": 1700000009,
-                    "time_window": 3600,
-                    "time_interval": 10,
-                    'min_value': -50,
-                    'max_value': 50,
-                    "output_type": OutputType.VALUES
-                },
-                {
-                    'start_time': 1700000009,
-                    'time_window': 3600,
-                    'time_interval': 10,
-                    'n_decimals': 3,
-                    'min_value': -50, 'max_value': 50,
-                    'output_type': OutputType.VALUES,
-                    'output_average': OutputAverageEnum.COMPLETE,
-                    'time_ref_start': TimeRefEnum.BY_TIME
-                }
-            ),
-            (
-                {
-                    "start_time": 1700000009,
-                    "time_window": 3600,
-                    "time_interval": 10,
-                    'min_value': -50.5,
-                    'max_value': 50.5,
-                    "output_type": OutputType.VALUES
-                },
-                {
-                    "start_time": 1700000009,
-                    "time_window": 3600,
-                    'time_interval': 10,
-                    'n_decimals': 3,
-                    'min_value': -50.5, 'max_value': 50.5,
-                    'output_type': OutputType.VALUES,
-                    'output_average': OutputAverageEnum.COMPLETE,
-                    'time_ref_start': TimeRefEnum.BY_TIME
-                }
-            ),
-            (
-                {
-                    "start_time": 0,
-                    "time_window": 0,
-                    "time_interval": 0,
-                    "output_type": OutputType.VALUES
-                },
-                {
-                    "start_time": 0,
-                    "time_window": 0,
-                    'time_interval': 0,
-                    'n_decimals': 3,
-                    'min_value': None, 'max_value': None,
-                    'output_type': OutputType.VALUES,
-                    'output_average': OutputAverageEnum.COMPLETE,
-                    'time_ref_start': TimeRefEnum.BY_TIME
-                }
-            ),
-            (
-                {},
-                {
-                    "start_time": 0,
-                    "time_window": 0,
-                    'time_interval': 0,
-                    'n_decimals': 3,
-                    'min_value': None, 'max_value': None,
-                    'output_type': OutputType.TIME_SERIES,
-                    'output_average': OutputAverageEnum.COMPLETE,
-                    'time_ref_start': TimeRefEnum.BY_TIME
-                }
-            ),
-        ],
-    )
-    def test_valid(
-        self,
-        kwargs,
-        expected
-    ):
+    def test_valid(self, by_time_params_case):
         """
-        Test FinaData initialization with invalid parameters.
+        Test FinaData initialization with valid parameters.
         """
-        result = FinaByTimeParamsModel(**kwargs)
+        result, expected = by_time_params_case
         assert dict(result) == expected
 
     @pytest.mark.parametrize(
@@ -130,7 +287,7 @@ class TestFinaByTimeParamsModel:
                     "time_interval": -1,
                 },
                 ValidationError,
-                "3 validation errors for FinaByTimeParamsModel\n.*"
+                ERR_BY_TIME_3
             ),
             (
                 {
@@ -141,7 +298,7 @@ class TestFinaByTimeParamsModel:
                     "max_value": "0",
                 },
                 ValidationError,
-                "7 validation errors for FinaByTimeParamsModel\n.*"
+                ERR_BY_TIME_7
             ),
             (
                 {
@@ -150,7 +307,7 @@ class TestFinaByTimeParamsModel:
                     "time_interval": 1.1,
                 },
                 ValidationError,
-                "3 validation errors for FinaByTimeParamsModel\n.*"
+                ERR_BY_TIME_3
             ),
 
         ],
@@ -175,48 +332,11 @@ class TestFinaMetaModel:
 
     This test suite validates the functionality of FinaMetaModel Validators
     """
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "interval": 10,
-                    "start_time": 1700000009,
-                    "end_time": 1700003609,
-                    "npoints": 100,
-                    "size": 4096
-                },
-                {
-                    "interval": 10,
-                    "start_time": 1700000009,
-                    "end_time": 1700003609,
-                    "npoints": 100,
-                    "size": 4096
-                }
-            ),
-            (
-                {
-                    "interval": 0,
-                    "start_time": 0,
-                    "end_time": 0,
-                    "npoints": 0,
-                    "size": 0
-                },
-                {
-                    "interval": 0,
-                    "start_time": 0,
-                    "end_time": 0,
-                    "npoints": 0,
-                    "size": 0
-                }
-            ),
-        ],
-    )
-    def test_valid(self, kwargs, expected):
+    def test_valid(self, meta_case):
         """
         Test FinaMetaModel initialization with valid parameters.
         """
-        result = FinaMetaModel(**kwargs)
+        result, expected = meta_case
         assert dict(result) == expected
 
     @pytest.mark.parametrize(
@@ -231,7 +351,7 @@ class TestFinaMetaModel:
                     "size": -1
                 },
                 ValidationError,
-                "5 validation errors for FinaMetaModel\n.*"
+                ERR_META_5
             ),
             (
                 {
@@ -242,7 +362,7 @@ class TestFinaMetaModel:
                     "size": 4096
                 },
                 ValidationError,
-                "start_time must be less than end_time."
+                ERR_META_TIMES
             ),
             (
                 {
@@ -253,7 +373,7 @@ class TestFinaMetaModel:
                     "size": "4096"
                 },
                 ValidationError,
-                "4 validation errors for FinaMetaModel\n.*"
+                ERR_META_4
             ),
         ],
     )
@@ -272,138 +392,18 @@ class TestFileReaderPropsModel:
     This test suite validates the functionality
     of FileReaderPropsModel Validators
     """
-    @pytest.mark.parametrize(
-        "kwargs, expected",
-        [
-            (
-                {
-                    "meta": {
-                        "interval": 10,
-                        "start_time": 1700000009,
-                        "end_time": 1700003609,
-                        "npoints": 100,
-                        "size": 4096
-                    },
-                    "search": {
-                        "start_time": 1700000009,
-                        "time_window": 3600,
-                        "time_interval": 10,
-                        "output_type": OutputType.VALUES
-                    },
-                    "current_pos": 0,
-                    "start_pos": 0,
-                    "chunk_size": 1024,
-                    "remaining_points": 0,
-                    "start_search": 0,
-                    "window_search": 0,
-                    "block_size": 0,
-                    "current_window": 0,
-                    "window_max": 0,
-                    "current_start": 0,
-                    "next_start": 0,
-                    "auto_pos": True
-                },
-                {
-                    "meta": {
-                        "interval": 10,
-                        "start_time": 1700000009,
-                        "end_time": 1700003609,
-                        "npoints": 100,
-                        "size": 4096
-                    },
-                    "search": {
-                        "start_time": 1700000009,
-                        "time_window": 3600,
-                        "time_interval": 10,
-                        'n_decimals': 3,
-                        "min_value": None,
-                        "max_value": None,
-                        "output_type": OutputType.VALUES,
-                        "output_average": OutputAverageEnum.COMPLETE,
-                        "time_ref_start": TimeRefEnum.BY_TIME
-                    },
-                    "current_pos": 0,
-                    "start_pos": 0,
-                    "chunk_size": 1024,
-                    "remaining_points": 0,
-                    "start_search": 0,
-                    "window_search": 0,
-                    "block_size": 0,
-                    "current_window": 0,
-                    "window_max": 0,
-                    "current_start": 0,
-                    "next_start": 0,
-                    "auto_pos": True
-                }
-            ),
-            (
-                {
-                    "meta": {
-                        "interval": 0,
-                        "start_time": 0,
-                        "end_time": 0,
-                        "npoints": 0,
-                        "size": 0
-                    },
-                    "search": {
-                        "start_time": 0,
-                        "time_window": 0,
-                        "time_interval": 0,
-                        "output_type": OutputType.VALUES
-                    },
-                    "current_pos": 0,
-                    "start_pos": 0,
-                    "chunk_size": 0,
-                    "remaining_points": 0,
-                    "start_search": 0,
-                    "window_search": 0,
-                    "block_size": 0,
-                    "current_window": 0,
-                    "window_max": 0,
-                    "current_start": 0,
-                    "next_start": 0,
-                    "auto_pos": True
-                },
-                {
-                    "meta": {
-                        "interval": 0,
-                        "start_time": 0,
-                        "end_time": 0,
-                        "npoints": 0,
-                        "size": 0
-                    },
-                    "search": {
-                        "start_time": 0,
-                        "time_window": 0,
-                        "time_interval": 0,
-                        'n_decimals': 3,
-                        "min_value": None,
-                        "max_value": None,
-                        "output_type": OutputType.VALUES,
-                        "output_average": OutputAverageEnum.COMPLETE,
-                        "time_ref_start": TimeRefEnum.BY_TIME
-                    },
-                    "current_pos": 0,
-                    "start_pos": 0,
-                    "chunk_size": 0,
-                    "remaining_points": 0,
-                    "start_search": 0,
-                    "window_search": 0,
-                    "block_size": 0,
-                    "current_window": 0,
-                    "window_max": 0,
-                    "current_start": 0,
-                    "next_start": 0,
-                    "auto_pos": True
-                }
-            ),
-        ],
-    )
-    def test_valid(self, kwargs, expected):
+    def test_valid(self, reader_props_case):
         """
         Test FileReaderPropsModel initialization with valid parameters.
         """
-        result = FileReaderPropsModel(**kwargs)
+        result, expected = reader_props_case
+        assert result.model_dump() == expected
+
+    def test_valid_trusted(self, trusted_reader_props_case):
+        """
+        Test FileReaderPropsModel dump of trusted constructed models.
+        """
+        result, expected = trusted_reader_props_case
         assert result.model_dump() == expected
 
     @pytest.mark.parametrize(
@@ -438,7 +438,7 @@ class TestFileReaderPropsModel:
                     "auto_pos": True
                 },
                 ValidationError,
-                "19 validation errors for FileReaderPropsModel\n.*"
+                ERR_PROPS_19
             )
         ],
     )
@@ -5,6 +5,7 @@ Ensures full coverage, including security, file validation,
 and edge cases. Uses pytest best practices with TestClass
 and @pytest.mark.parametrize.
 """
+from contextlib import ExitStack
 from struct import pack
 from unittest.mock import patch, mock_open
 import pytest
@@ -15,27 +16,49 @@ from emon_tools.emon_fina.fina_models import (
 )
 from tests.emon_fina.fina_data_test import EmonFinaDataTest
 
+# Uniform 42.0 float32 data buffer, sliced by read file mocks
+F42_BUF = pack("<f", 42.0) * 4096
+
 
 class TestFinaReader:
     """
     Test suite for FinaReader class.
     Ensures correct initialization, file handling, and data security.
     """
-    @pytest.fixture
-    def tmp_path_override(self, tmp_path):
+    @pytest.fixture(scope="module")
+    def tmp_path_override(self, tmp_path_factory):
         """
         Provide a fixture for a valid temporary path
         to simulate data directory.
         """
-        data_dir = tmp_path / "test_data"
-        data_dir.mkdir()
-        return str(data_dir)
+        return str(tmp_path_factory.mktemp("test_data"))
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_fina_reader(self, tmp_path_override):
         """Fixture for initializing FinaReader with valid parameters."""
         return FinaReader(file_name="testfile", data_dir=tmp_path_override)
 
+    @pytest.fixture
+    def fina_io_mocks(self, request):
+        """
+        Patch open, isfile and getsize for fina reader file access.
+
+        Indirect param is a (read_data, file_size) tuple,
+        yields the (open, isfile, getsize) mocks.
+        """
+        read_data, file_size = request.param
+        with ExitStack() as stack:
+            yield (
+                stack.enter_context(patch(
+                    "builtins.open", mock_open(read_data=read_data))),
+                stack.enter_context(patch(
+                    "emon_tools.emon_fina.fina_reader.isfile",
+                    return_value=True)),
+                stack.enter_context(patch(
+                    "emon_tools.emon_fina.fina_reader.getsize",
+                    return_value=file_size)),
+            )
+
     @pytest.mark.parametrize(
         "file_name, data_dir, expected_exception",
         [
@@ -125,6 +148,27 @@ class TestFinaReader:
             with pytest.raises(FileNotFoundError):
                 valid_fina_reader._get_data_path()
 
+    def test_get_paths_sanitized_once(self, tmp_path_override):
+        """Test meta and data paths are sanitized once per reader."""
+        reader = FinaReader(file_name="testfile", data_dir=tmp_path_override)
+        with patch.object(
+                reader, "_sanitize_path",
+                wraps=reader._sanitize_path) as mock_sanitize, \
+            patch(
+                "emon_tools.emon_fina.fina_reader.isfile",
+                return_value=True), \
+            patch(
+                "emon_tools.emon_fina.fina_reader.getsize",
+                return_value=400):
+            meta_path = reader._get_meta_path()
+            data_path = reader._get_data_path()
+            assert reader._get_meta_path() == meta_path
+            assert reader._get_data_path() == data_path
+        assert meta_path.endswith("testfile.meta")
+        assert data_path.endswith("testfile.dat")
+        assert mock_sanitize.call_count == 2
+
+    @pytest.mark.slow
     def test_read_meta_invalid_content(self, valid_fina_reader):
         """Test read_meta for corrupted meta file."""
         mock_file = mock_open(read_data=b"\x00" * 7)
@@ -138,16 +182,10 @@ class TestFinaReader:
             with pytest.raises(OSError):
                 valid_fina_reader.read_meta()
 
-    @patch("builtins.open",
-           new_callable=mock_open,
-           read_data=pack("<2I", 10, 1000000))
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=400)
-    def test_read_meta(self,
-                       mock_getsize,
-                       mock_isfile,
-                       mock_open_file,
-                       valid_fina_reader):
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "fina_io_mocks", [(pack("<4I", 0, 0, 10, 1000000), 400)], indirect=True)
+    def test_read_meta(self, fina_io_mocks, valid_fina_reader):
         """
         Test reading metadata from the meta file.
         """
@@ -159,16 +197,10 @@ class TestFinaReader:
         assert meta.end_time == 1000990
 
     # Invalid interval
-    @patch("builtins.open",
-           new_callable=mock_open,
-           read_data=pack("<2I", 0, 1000000))
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=400)
-    def test_read_meta_invalid(self,
-                               mock_getsize,
-                               mock_isfile,
-                               mock_open_file,
-                               valid_fina_reader):
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "fina_io_mocks", [(pack("<4I", 0, 0, 0, 1000000), 400)], indirect=True)
+    def test_read_meta_invalid(self, fina_io_mocks, valid_fina_reader):
         """
         Test reading invalid metadata from the meta file.
         """
@@ -179,28 +211,25 @@ class TestFinaReader:
             valid_fina_reader.read_meta()
 
     # Less than 8 bytes
-    @patch("builtins.open", new_callable=mock_open, read_data=b"1234")
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=400)
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "fina_io_mocks", [(b"1234", 400)], indirect=True)
     def test_read_meta_corrupted_meta_file(
         self,
-        mock_getsize,
-        mock_isfile,
-        mock_open_file,
+        fina_io_mocks,
         valid_fina_reader
     ):
         """
         Test that ValueError is raised when the meta file is corrupted
         (i.e., insufficient bytes are read).
         """
+        expected_path = valid_fina_reader._get_meta_path()
         with pytest.raises(IOError, match=r"Error reading meta file: .*"):
             valid_fina_reader.read_meta()
 
         # Ensure the correct file was attempted to open
-        mock_open_file.assert_called_once_with(
-            valid_fina_reader._get_meta_path(),
-            "rb"
-        )
+        mock_open_file = fina_io_mocks[0]
+        mock_open_file.assert_called_once_with(expected_path, "rb")
 
     def test_initialise_reader(self, valid_fina_reader):
         """Test initialise_reader sets props correctly."""
@@ -219,6 +248,7 @@ class TestFinaReader:
         valid_fina_reader.initialise_reader(meta, props)
         assert isinstance(valid_fina_reader.props, FileReaderProps)
 
+    @pytest.mark.slow
     def test_read_file_empty(self, valid_fina_reader):
         """Test read_file handles empty files correctly."""
         with patch(
@@ -246,20 +276,14 @@ class TestFinaReader:
             with pytest.raises(ValueError):
                 list(valid_fina_reader.read_file())
 
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data=pack("<f", 42.0) * 360
-    )
-    @patch("emon_tools.emon_fina.fina_reader.isfile", return_value=True)
-    @patch("emon_tools.emon_fina.fina_reader.getsize", return_value=1440)
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "fina_io_mocks", [(F42_BUF[:1440], 1440)], indirect=True)
     @patch("emon_tools.emon_fina.fina_reader.mmap.mmap", autospec=True)
     def test_read_file(
         self,
         mock_mmap,
-        mock_open_file,
-        mock_isfile,
-        mock_getsize,
+        fina_io_mocks,
         valid_fina_reader
     ):
         """
@@ -275,7 +299,7 @@ class TestFinaReader:
             "time_interval": 10
         })
         reader_props = FileReaderProps(
-            meta=FinaMeta(**meta_dict),
+            meta=EmonFinaDataTest.get_fina_meta_slim_model(),
             search=search
         )
         reader_props.initialise_reader()
@@ -287,8 +311,7 @@ class TestFinaReader:
         # Handle slice inputs to mimic actual mmap slicing behavior.
         def mock_getitem(slice_obj):
             if isinstance(slice_obj, slice):
-                size = (slice_obj.stop - slice_obj.start) // 4
-                return pack("<f", 42.0) * size
+                return F42_BUF[:slice_obj.stop - slice_obj.start]
             raise ValueError("Invalid slice input")
 
         mock_mmap_instance.__getitem__.side_effect = mock_getitem
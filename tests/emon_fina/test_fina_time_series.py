@@ -12,7 +12,7 @@ from unittest.mock import MagicMock
 import numpy as np
 import pandas as pd
 import pytest
-from emon_tools.emon_fina.fina_services import FileReaderProps, FinaMeta
+from emon_tools.emon_fina.fina_services import FileReaderProps
 from emon_tools.emon_fina.fina_time_series import FinaDataFrame
 from emon_tools.emon_fina.fina_utils import Utils
 from emon_tools.emon_fina.fina_models import FinaByDateParamsModel
@@ -31,9 +31,8 @@ class TestFinaDataFrame:
         """Fixture to mock the FinaReader."""
         mock_reader = MagicMock()
         # Two days of data at 10-second intervals
-        mock_reader.read_meta.return_value = FinaMeta(
-            **EmonFinaDataTest.get_fina_meta_slim()
-        )
+        mock_reader.read_meta.return_value = (
+            EmonFinaDataTest.get_fina_meta_slim_model())
         mock_reader.DEFAULT_CHUNK_SIZE = 1024
         mock_reader.CHUNK_SIZE_LIMIT = 4096
         return mock_reader
@@ -63,7 +62,8 @@ class TestFinaDataFrame:
         self,
         kwargs,
         expected,
-        mock_reader_meta
+        mock_reader_meta,
+        monkeypatch
     ):
         """
         Test get_fina_time_series method.
@@ -76,14 +76,11 @@ class TestFinaDataFrame:
             )
         ]  # Mocked data
         reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
+            meta=EmonFinaDataTest.get_fina_meta_slim_model(),
             search=search
         )
         reader_props.initialise_reader()
         mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
         monkeypatch.setattr(
             "emon_tools.emon_fina.emon_fina.FinaReader",
             lambda *args,
@@ -121,7 +118,8 @@ class TestFinaDataFrame:
         self,
         kwargs,
         expected,
-        mock_reader_meta
+        mock_reader_meta,
+        monkeypatch
     ):
         """
         Test get_fina_values_by_date method.
@@ -141,14 +139,11 @@ class TestFinaDataFrame:
             )
         ]  # Mocked data
         reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
+            meta=EmonFinaDataTest.get_fina_meta_slim_model(),
             search=search_t
         )
         reader_props.initialise_reader()
         mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
         monkeypatch.setattr(
             "emon_tools.emon_fina.emon_fina.FinaReader",
             lambda *args,
@@ -185,7 +180,8 @@ class TestFinaDataFrame:
         self,
         kwargs,
         expected,
-        mock_reader_meta
+        mock_reader_meta,
+        monkeypatch
     ):
         """
         Test get_fina_values_by_date method.
@@ -207,14 +203,11 @@ class TestFinaDataFrame:
             )
         ]  # Mocked data
         reader_props = FileReaderProps(
-            meta=FinaMeta(
-                **EmonFinaDataTest.get_fina_meta_slim()
-            ),
+            meta=EmonFinaDataTest.get_fina_meta_slim_model(),
             search=search_t
         )
         reader_props.initialise_reader()
         mock_reader_meta.props = reader_props
-        monkeypatch = pytest.MonkeyPatch()
         monkeypatch.setattr(
             "emon_tools.emon_fina.emon_fina.FinaReader",
             lambda *args,
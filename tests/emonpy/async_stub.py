@@ -0,0 +1,64 @@
+"""
+Lightweight awaitable stub for async tests.
+"""
+from typing import Any
+
+
+class FastAsyncStub:
+    """
+    Minimal AsyncMock replacement.
+
+    Supports `return_value`, `side_effect` (exception, callable
+    or iterable) and `reset_mock`,
+    without AsyncMock spec and call tracking overhead.
+    """
+    __slots__ = ("return_value", "_side_effect")
+
+    def __init__(self, return_value: Any = None, side_effect: Any = None):
+        self.return_value = return_value
+        self._side_effect = None
+        self.side_effect = side_effect
+
+    @staticmethod
+    def _is_exception(value: Any) -> bool:
+        """Test if value is an exception instance or class."""
+        return isinstance(value, BaseException)\
+            or (isinstance(value, type) and issubclass(value, BaseException))
+
+    @property
+    def side_effect(self) -> Any:
+        """Get side effect."""
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value: Any) -> None:
+        """Set side effect, iterables are consumed one item per await."""
+        if value is not None\
+                and not self._is_exception(value)\
+                and not callable(value):
+            value = iter(value)
+        self._side_effect = value
+
+    async def __call__(self, *args, **kwargs):
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if self._is_exception(effect):
+            raise effect
+        if callable(effect):
+            return effect(*args, **kwargs)
+        result = next(effect)
+        if self._is_exception(result):
+            raise result
+        return result
+
+    def reset_mock(
+        self,
+        return_value: bool = False,
+        side_effect: bool = False
+    ) -> None:
+        """Optionally reset return value and side effect."""
+        if return_value:
+            self.return_value = None
+        if side_effect:
+            self._side_effect = None
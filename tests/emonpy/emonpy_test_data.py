@@ -218,51 +218,81 @@ class EmonpyDataTest:
         ),
     ]
 
-    CREATE_INPUT_FEEDS_PARAMS = [
+    CREATE_INPUT_FEEDS_PARAMS = (
         (
             # feeds
             [{"name": "feed1", "tag": "tag1"}],
             # create_feed_results
-            [{"message": {"feedid": "1"}, SUCCESS_KEY: True}],
+            ({"message": {"feedid": "1"}, SUCCESS_KEY: True},),
             # expected_processes
             [[1, 1]],
+            # raises_match
+            None,
         ),
         (
             # feeds
             [{"name": "feed1", "tag": "tag1", "process": "1:1"}],
             # create_feed_results
-            [{"message": {"feedid": "1"}, SUCCESS_KEY: True}],
+            ({"message": {"feedid": "1"}, SUCCESS_KEY: True},),
             # expected_processes
             [[1, 1]],
+            # raises_match
+            None,
         ),
         (
             # feeds
             [],
             # create_feed_results
-            [],
+            (),
             # expected_processes
             [],
+            # raises_match
+            None,
         ),
-    ]
+        (
+            # feeds
+            [{"name": "feed1", "tag": "tag1"}],
+            # create_feed_results
+            ({"message": "Error", SUCCESS_KEY: False},),
+            # expected_processes
+            None,
+            # raises_match
+            "Fatal error: Unable to set feed structure.*",
+        ),
+    )
 
-    CREATE_INPUTS_PARAMS = [
+    CREATE_INPUTS_PARAMS = (
         (
             # inputs
             [{"nodeid": "node1", "name": "input1"}],
             # post_inputs_responses
-            [{"message": {}, SUCCESS_KEY: True}],
+            ({"message": {}, SUCCESS_KEY: True},),
             # expected_count
             1,
+            # raises_match
+            None,
         ),
         (
             # inputs
             [],
             # post_inputs_responses
-            [],
+            (),
             # expected_count
             0,
+            # raises_match
+            None,
         ),
-    ]
+        (
+            # inputs
+            [{"nodeid": "node1", "name": "input1"}],
+            # post_inputs_responses
+            ({"message": "Error", SUCCESS_KEY: False},),
+            # expected_count
+            None,
+            # raises_match
+            "Fatal error: Unable to set inputs structure.*",
+        ),
+    )
 
     INIT_INPUTS_STRUCTURE_PARAMS = [
         (
@@ -509,6 +539,34 @@ class EmonpyDataTest:
         ),
     ]
 
+    STRUCTURE_ERROR = "Fatal Error, inputs was not added to server."
+
+    CREATE_STRUCTURE_MOCKS = (
+        "init_inputs_structure",
+        "get_structure",
+        "add_input_feeds_structure",
+        "update_input_fields",
+        "update_input_process_list",
+    )
+
+    @staticmethod
+    def wire_create_structure(
+        api,
+        structure: list,
+        get_structure_return: tuple,
+        raises_error: bool
+    ):
+        """Set responses of the mocked create_structure dependencies."""
+        api.init_inputs_structure.return_value = len(structure)
+        api.get_structure.return_value = get_structure_return
+        api.add_input_feeds_structure.return_value = (0, [])
+        api.update_input_fields.return_value = 0
+        api.update_input_process_list.return_value = 0
+        if raises_error is True:
+            api.add_input_feeds_structure.side_effect = ValueError(
+                EmonpyDataTest.STRUCTURE_ERROR
+            )
+
     GET_EXTENDED_STRUCTURE_PARAMS = [
         (
             # structure
@@ -8,26 +8,96 @@ This module tests the functionality of the AsyncEmonPy class, ensuring:
 
 Test coverage is designed to achieve 100% coverage with appropriate mocks.
 """
-from unittest.mock import AsyncMock
+import asyncio
+import re
 import pytest
 from emon_tools.emonpy.async_emonpy import AsyncEmonPy
-from emon_tools.emon_api.api_utils import SUCCESS_KEY
 from tests.emonpy.emonpy_test_data import EmonpyDataTest as dtest
+from tests.emonpy.async_stub import FastAsyncStub
+
+
+GET_STRUCTURE_PARAMS = tuple(dtest.GET_STRUCTURE_PARAMS)
+CREATE_INPUT_FEEDS_PARAMS = tuple(dtest.CREATE_INPUT_FEEDS_PARAMS)
+CREATE_INPUTS_PARAMS = tuple(dtest.CREATE_INPUTS_PARAMS)
+INIT_INPUTS_STRUCTURE_PARAMS = tuple(dtest.INIT_INPUTS_STRUCTURE_PARAMS)
+ADD_INPUT_FEEDS_STRUCTURE_PARAMS = tuple(
+    dtest.ADD_INPUT_FEEDS_STRUCTURE_PARAMS)
+UPDATE_INPUT_FIELDS_PARAMS = tuple(dtest.UPDATE_INPUT_FIELDS_PARAMS)
+UPDATE_INPUT_PROCESS_LIST_PARAMS = tuple(
+    dtest.UPDATE_INPUT_PROCESS_LIST_PARAMS)
+CREATE_STRUCTURE_PARAMS = tuple(dtest.CREATE_STRUCTURE_PARAMS)
+GET_EXTENDED_STRUCTURE_PARAMS = tuple(dtest.GET_EXTENDED_STRUCTURE_PARAMS)
+
+
+def case_ids(params: tuple) -> list:
+    """Get compact parametrize ids for a test data table."""
+    return [f"case{index}" for index in range(len(params))]
+
+
+API_MOCKS = (
+    "async_list_inputs_fields",
+    "async_list_feeds",
+    "async_create_feed",
+    "async_post_inputs",
+    "async_set_input_fields",
+    "async_set_input_process_list",
+)
+METHOD_MOCKS = (
+    "create_inputs",
+    "create_input_feeds",
+    "init_inputs_structure",
+    "get_structure",
+    "add_input_feeds_structure",
+    "update_input_fields",
+    "update_input_process_list",
+)
+
+
+def new_api() -> AsyncEmonPy:
+    """Create an AsyncEmonPy instance with mocked api requests."""
+    emon = AsyncEmonPy(url="http://test-url", api_key="123")
+    for name in API_MOCKS:
+        setattr(emon, name, FastAsyncStub())
+    return emon
+
+
+def assert_case_result(result, expected_result, raises_match):
+    """Assert a gathered case result or its expected ValueError."""
+    if raises_match is not None:
+        assert isinstance(result, ValueError)
+        assert re.search(raises_match, str(result))
+    else:
+        assert result == expected_result
 
 
 class TestAsyncEmonPy:
     """Unit tests for the AsyncEmonPy class."""
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def api(self):
         """Fixture to create an instance of AsyncEmonPy."""
-        emon = AsyncEmonPy(url="http://test-url", api_key="123")
-        emon.async_list_inputs_fields = AsyncMock()
-        emon.async_list_feeds = AsyncMock()
-        emon.async_create_feed = AsyncMock()
-        emon.async_post_inputs = AsyncMock()
-        emon.async_set_input_fields = AsyncMock()
-        emon.async_set_input_process_list = AsyncMock()
-        return emon
+        return new_api()
+
+    @pytest.fixture(scope="module")
+    def methods(self):
+        """Fixture of pre-built AsyncEmonPy methods mocks."""
+        return {name: FastAsyncStub() for name in METHOD_MOCKS}
+
+    @pytest.fixture(autouse=True)
+    def reset_api(self, api, methods):
+        """Reset the shared api and methods mocks after each test."""
+        yield
+        mocks = [getattr(api, name) for name in API_MOCKS]
+        mocks += methods.values()
+        for mock in mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture
+    def mock_methods(self, api, methods, monkeypatch):
+        """Patch api methods with pre-built mocks for one test."""
+        def _mock_methods(*names):
+            for name in names:
+                monkeypatch.setattr(api, name, methods[name])
+        return _mock_methods
 
     def test_init(self):
         """Test initialization of EmonPy."""
@@ -36,135 +106,118 @@ class TestAsyncEmonPy:
         assert emon.url == "http://example.com"
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "inputs_response, feeds_response, expected_result",
-        dtest.GET_STRUCTURE_PARAMS
-    )
-    async def test_get_structure(
-        self,
-        api,
-        inputs_response,
-        feeds_response,
-        expected_result
-    ):
+    async def test_get_structure(self):
         """
         Test the get_structure method.
 
         This method validates the behavior
         of get_structure under various API response conditions.
+        Cases are independent and run concurrently.
         """
-        api.async_list_inputs_fields.return_value = inputs_response
-        api.async_list_feeds.return_value = feeds_response
-
-        result = await api.get_structure()
+        async def _run(inputs_response, feeds_response):
+            emon = new_api()
+            emon.async_list_inputs_fields.return_value = inputs_response
+            emon.async_list_feeds.return_value = feeds_response
+            return await emon.get_structure()
 
-        assert result == expected_result
+        results = await asyncio.gather(*(
+            _run(inputs_response, feeds_response)
+            for inputs_response, feeds_response, _
+            in GET_STRUCTURE_PARAMS
+        ))
+        for result, (*_, expected_result) in zip(
+                results, GET_STRUCTURE_PARAMS):
+            assert result == expected_result
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "feeds, create_feed_results, expected_processes",
-        dtest.CREATE_INPUT_FEEDS_PARAMS,
-    )
-    async def test_create_input_feeds(
-        self,
-        api,
-        feeds,
-        create_feed_results,
-        expected_processes
-    ):
+    async def test_create_input_feeds(self):
         """
         Test the create_input_feeds method.
 
         This method validates successful creation and error handling for feeds.
+        Cases are independent and run concurrently.
         """
-        api.async_create_feed.side_effect = create_feed_results
-
-        _, result = await api.create_input_feeds(feeds=feeds)
-        assert result == expected_processes
+        async def _run(feeds, create_feed_results):
+            emon = new_api()
+            emon.async_create_feed.side_effect = iter(create_feed_results)
+            _, processes = await emon.create_input_feeds(feeds=feeds)
+            return processes
 
-    @pytest.mark.asyncio
-    async def test_create_input_feeds_invalid(
-        self,
-        api
-    ):
-        """Test the create_input_feeds method."""
-        api.async_create_feed.side_effect = [
-            {"message": "Error", SUCCESS_KEY: False}
-        ]
-
-        with pytest.raises(
-                ValueError,
-                match="Fatal error: Unable to set feed structure.*"):
-            await api.create_input_feeds(
-                feeds=[{"name": "feed1", "tag": "tag1"}])
+        results = await asyncio.gather(
+            *(
+                _run(feeds, create_feed_results)
+                for feeds, create_feed_results, *_
+                in CREATE_INPUT_FEEDS_PARAMS
+            ),
+            return_exceptions=True
+        )
+        for result, (*_, expected_processes, raises_match) in zip(
+                results, CREATE_INPUT_FEEDS_PARAMS):
+            assert_case_result(result, expected_processes, raises_match)
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "inputs, post_inputs_responses, expected_count",
-        dtest.CREATE_INPUTS_PARAMS
-    )
-    async def test_create_inputs(
-        self,
-        api,
-        inputs,
-        post_inputs_responses,
-        expected_count
-    ):
-        """Test the create_inputs method."""
-        api.async_post_inputs.side_effect = post_inputs_responses
-
-        result = await api.create_inputs(inputs=inputs)
-        assert result == expected_count
+    async def test_create_inputs(self):
+        """
+        Test the create_inputs method.
 
-    @pytest.mark.asyncio
-    async def test_create_inputs_invalid(
-        self,
-        api
-    ):
-        """Test the create_input_feeds method."""
-        api.async_post_inputs.side_effect = [
-            {"message": "Error", SUCCESS_KEY: False}
-        ]
+        Cases are independent and run concurrently.
+        """
+        async def _run(inputs, post_inputs_responses):
+            emon = new_api()
+            emon.async_post_inputs.side_effect = iter(post_inputs_responses)
+            return await emon.create_inputs(inputs=inputs)
 
-        with pytest.raises(
-                ValueError,
-                match="Fatal error: Unable to set inputs structure.*"):
-            await api.create_inputs(
-                inputs=[{"nodeid": "node1", "name": "input1"}])
+        results = await asyncio.gather(
+            *(
+                _run(inputs, post_inputs_responses)
+                for inputs, post_inputs_responses, *_
+                in CREATE_INPUTS_PARAMS
+            ),
+            return_exceptions=True
+        )
+        for result, (*_, expected_count, raises_match) in zip(
+                results, CREATE_INPUTS_PARAMS):
+            assert_case_result(result, expected_count, raises_match)
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "structure, inputs, expected_count",
-        dtest.INIT_INPUTS_STRUCTURE_PARAMS
+        INIT_INPUTS_STRUCTURE_PARAMS,
+        ids=case_ids(INIT_INPUTS_STRUCTURE_PARAMS)
     )
     async def test_init_inputs_structure(
         self,
         api,
+        mock_methods,
         structure,
         inputs,
         expected_count
     ):
         """Test the init_inputs_structure method."""
-        api.list_inputs_fields = AsyncMock(return_value=inputs)
-        api.create_inputs = AsyncMock(return_value=expected_count)
+        mock_methods("create_inputs")
+        api.async_list_inputs_fields.return_value = inputs
+        api.create_inputs.return_value = expected_count
         result = await api.init_inputs_structure(structure=structure)
         assert result == expected_count
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "input_item, feeds_on, expected_created, expected_process",
-        dtest.ADD_INPUT_FEEDS_STRUCTURE_PARAMS
+        ADD_INPUT_FEEDS_STRUCTURE_PARAMS,
+        ids=case_ids(ADD_INPUT_FEEDS_STRUCTURE_PARAMS)
     )
     async def test_add_input_feeds_structure(
         self,
         api,
+        mock_methods,
         input_item,
         feeds_on,
         expected_created,
         expected_process
     ):
         """Test the init_inputs_structure method."""
-        api.create_input_feeds = AsyncMock(return_value=expected_created)
+        mock_methods("create_input_feeds")
+        api.create_input_feeds.return_value = expected_created
         _, result = await api.add_input_feeds_structure(
             input_item=input_item,
             feeds_on=feeds_on)
@@ -176,7 +229,8 @@ class TestAsyncEmonPy:
             "input_id, current, description, "
             "set_input_fields_response, expected_result"
         ),
-        dtest.UPDATE_INPUT_FIELDS_PARAMS
+        UPDATE_INPUT_FIELDS_PARAMS,
+        ids=case_ids(UPDATE_INPUT_FIELDS_PARAMS)
     )
     async def test_update_input_fields(
         self,
@@ -201,7 +255,8 @@ class TestAsyncEmonPy:
             "input_id, current_processes, new_processes, "
             "set_process_list_response, expected_result"
         ),
-        dtest.UPDATE_INPUT_PROCESS_LIST_PARAMS
+        UPDATE_INPUT_PROCESS_LIST_PARAMS,
+        ids=case_ids(UPDATE_INPUT_PROCESS_LIST_PARAMS)
     )
     async def test_update_input_process_list(
         self,
@@ -228,36 +283,25 @@ class TestAsyncEmonPy:
             "structure, get_structure_return, "
             "raises_error, expected_result"
         ),
-        dtest.CREATE_STRUCTURE_PARAMS
+        CREATE_STRUCTURE_PARAMS,
+        ids=case_ids(CREATE_STRUCTURE_PARAMS)
     )
     async def test_create_structure(
         self,
         api,
+        mock_methods,
         structure,
         get_structure_return,
         raises_error,
         expected_result,
     ):
         """Test the create_structure method."""
-        api.init_inputs_structure = AsyncMock(
-            return_value=len(structure))
-        api.get_structure = AsyncMock(
-            return_value=get_structure_return)
-        api.add_input_feeds_structure = AsyncMock(
-            return_value=(0, [])
-        )
-        api.update_input_fields = AsyncMock(return_value=0)
-        api.update_input_process_list = AsyncMock(return_value=0)
+        mock_methods(*dtest.CREATE_STRUCTURE_MOCKS)
+        dtest.wire_create_structure(
+            api, structure, get_structure_return, raises_error)
 
         if raises_error is True:
-            api.add_input_feeds_structure = AsyncMock(
-                side_effect=ValueError(
-                    "Fatal Error, inputs was not added to server."
-                )
-            )
-            with pytest.raises(
-                    ValueError,
-                    match="Fatal Error, inputs was not added to server."):
+            with pytest.raises(ValueError, match=dtest.STRUCTURE_ERROR):
                 await api.create_structure(structure=structure)
         else:
             result = await api.create_structure(
@@ -271,24 +315,24 @@ class TestAsyncEmonPy:
             "structure, get_structure_return, "
             "raises_error, expected_result"
         ),
-        dtest.GET_EXTENDED_STRUCTURE_PARAMS
+        GET_EXTENDED_STRUCTURE_PARAMS,
+        ids=case_ids(GET_EXTENDED_STRUCTURE_PARAMS)
     )
     async def test_get_extended_structure(
         self,
         api,
+        mock_methods,
         structure,
         get_structure_return,
         raises_error,
         expected_result,
     ):
         """Test the create_structure method."""
-        api.get_structure = AsyncMock(
-            return_value=get_structure_return)
+        mock_methods("get_structure")
+        api.get_structure.return_value = get_structure_return
 
         if raises_error is True:
-            with pytest.raises(
-                    ValueError,
-                    match="Fatal Error, inputs was not added to server."):
+            with pytest.raises(ValueError, match=dtest.STRUCTURE_ERROR):
                 await api.get_extended_structure(structure=structure)
         else:
             result = await api.get_extended_structure(
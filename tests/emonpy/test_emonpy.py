@@ -1,26 +1,65 @@
-"""Test Suite for EmonPy class."""
+"""Test Suite for EmonPy class.
+
+PYTEST_DONT_REWRITE
+"""
 from unittest.mock import MagicMock
 import pytest
-from emon_tools.emon_api.api_utils import SUCCESS_KEY
 from emon_tools.emonpy.emonpy import EmonPy
 from tests.emonpy.emonpy_test_data import EmonpyDataTest as dtest
 
 
+API_MOCKS = (
+    "list_inputs_fields",
+    "list_feeds",
+    "create_feed",
+    "post_inputs",
+    "set_input_fields",
+    "set_input_process_list",
+)
+METHOD_MOCKS = (
+    "create_inputs",
+    "create_input_feeds",
+    "init_inputs_structure",
+    "get_structure",
+    "add_input_feeds_structure",
+    "update_input_fields",
+    "update_input_process_list",
+)
+
+
 class TestEmonPy:
     """Unit tests for the EmonPy class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def api(self):
         """Fixture to provide an EmonPy instance."""
         emon = EmonPy(url="http://example.com", api_key="123")
-        emon.list_inputs_fields = MagicMock()
-        emon.list_feeds = MagicMock()
-        emon.create_feed = MagicMock()
-        emon.post_inputs = MagicMock()
-        emon.set_input_fields = MagicMock()
-        emon.set_input_process_list = MagicMock()
+        for name in API_MOCKS:
+            setattr(emon, name, MagicMock())
         return emon
 
+    @pytest.fixture(scope="module")
+    def methods(self):
+        """Fixture of pre-built EmonPy methods mocks."""
+        return {name: MagicMock() for name in METHOD_MOCKS}
+
+    @pytest.fixture(autouse=True)
+    def reset_api(self, api, methods):
+        """Reset the shared api and methods mocks after each test."""
+        yield
+        mocks = [getattr(api, name) for name in API_MOCKS]
+        mocks += methods.values()
+        for mock in mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture
+    def mock_methods(self, api, methods, monkeypatch):
+        """Patch api methods with pre-built mocks for one test."""
+        def _mock_methods(*names):
+            for name in names:
+                monkeypatch.setattr(api, name, methods[name])
+        return _mock_methods
+
     def test_init(self):
         """Test initialization of EmonPy."""
         emon = EmonPy(url="http://example.com", api_key="123")
@@ -84,7 +123,7 @@ class TestEmonPy:
         assert result == expected_result
 
     @pytest.mark.parametrize(
-        "feeds, create_feed_results, expected_processes",
+        "feeds, create_feed_results, expected_processes, raises_match",
         dtest.CREATE_INPUT_FEEDS_PARAMS,
     )
     def test_create_input_feeds(
@@ -92,30 +131,21 @@ class TestEmonPy:
         api,
         feeds,
         create_feed_results,
-        expected_processes
-    ):
-        """Test the create_input_feeds method."""
-        api.create_feed.side_effect = create_feed_results
-
-        _, result = api.create_input_feeds(feeds=feeds)
-        assert result == expected_processes
-
-    def test_create_input_feeds_invalid(
-        self,
-        api
+        expected_processes,
+        raises_match
     ):
         """Test the create_input_feeds method."""
-        api.create_feed.side_effect = [
-            {"message": "Error", SUCCESS_KEY: False}
-        ]
+        api.create_feed.side_effect = iter(create_feed_results)
 
-        with pytest.raises(
-                ValueError,
-                match="Fatal error: Unable to set feed structure.*"):
-            api.create_input_feeds(feeds=[{"name": "feed1", "tag": "tag1"}])
+        if raises_match is not None:
+            with pytest.raises(ValueError, match=raises_match):
+                api.create_input_feeds(feeds=feeds)
+        else:
+            _, result = api.create_input_feeds(feeds=feeds)
+            assert result == expected_processes
 
     @pytest.mark.parametrize(
-        "inputs, post_inputs_responses, expected_count",
+        "inputs, post_inputs_responses, expected_count, raises_match",
         dtest.CREATE_INPUTS_PARAMS
     )
     def test_create_inputs(
@@ -123,27 +153,18 @@ class TestEmonPy:
         api,
         inputs,
         post_inputs_responses,
-        expected_count
+        expected_count,
+        raises_match
     ):
         """Test the create_inputs method."""
-        api.post_inputs.side_effect = post_inputs_responses
-
-        result = api.create_inputs(inputs=inputs)
-        assert result == expected_count
-
-    def test_create_inputs_invalid(
-        self,
-        api
-    ):
-        """Test the create_input_feeds method."""
-        api.post_inputs.side_effect = [
-            {"message": "Error", SUCCESS_KEY: False}
-        ]
+        api.post_inputs.side_effect = iter(post_inputs_responses)
 
-        with pytest.raises(
-                ValueError,
-                match="Fatal error: Unable to set inputs structure.*"):
-            api.create_inputs(inputs=[{"nodeid": "node1", "name": "input1"}])
+        if raises_match is not None:
+            with pytest.raises(ValueError, match=raises_match):
+                api.create_inputs(inputs=inputs)
+        else:
+            result = api.create_inputs(inputs=inputs)
+            assert result == expected_count
 
     @pytest.mark.parametrize(
         "structure, inputs, expected_count",
@@ -152,13 +173,15 @@ class TestEmonPy:
     def test_init_inputs_structure(
         self,
         api,
+        mock_methods,
         structure,
         inputs,
         expected_count
     ):
         """Test the init_inputs_structure method."""
-        api.list_inputs_fields = MagicMock(return_value=inputs)
-        api.create_inputs = MagicMock(return_value=expected_count)
+        mock_methods("create_inputs")
+        api.list_inputs_fields.return_value = inputs
+        api.create_inputs.return_value = expected_count
         result = api.init_inputs_structure(structure=structure)
         assert result == expected_count
 
@@ -169,13 +192,15 @@ class TestEmonPy:
     def test_add_input_feeds_structure(
         self,
         api,
+        mock_methods,
         input_item,
         feeds_on,
         expected_created,
         expected_process
     ):
         """Test the init_inputs_structure method."""
-        api.create_input_feeds = MagicMock(return_value=expected_created)
+        mock_methods("create_input_feeds")
+        api.create_input_feeds.return_value = expected_created
         _, result = api.add_input_feeds_structure(
             input_item=input_item,
             feeds_on=feeds_on)
@@ -241,31 +266,19 @@ class TestEmonPy:
     def test_create_structure(
         self,
         api,
+        mock_methods,
         structure,
         get_structure_return,
         raises_error,
         expected_result,
     ):
         """Test the create_structure method."""
-        api.init_inputs_structure = MagicMock(
-            return_value=len(structure))
-        api.get_structure = MagicMock(
-            return_value=get_structure_return)
-        api.add_input_feeds_structure = MagicMock(
-            return_value=(0, [])
-        )
-        api.update_input_fields = MagicMock(return_value=0)
-        api.update_input_process_list = MagicMock(return_value=0)
+        mock_methods(*dtest.CREATE_STRUCTURE_MOCKS)
+        dtest.wire_create_structure(
+            api, structure, get_structure_return, raises_error)
 
         if raises_error is True:
-            api.add_input_feeds_structure = MagicMock(
-                side_effect=ValueError(
-                    "Fatal Error, inputs was not added to server."
-                )
-            )
-            with pytest.raises(
-                    ValueError,
-                    match="Fatal Error, inputs was not added to server."):
+            with pytest.raises(ValueError, match=dtest.STRUCTURE_ERROR):
                 api.create_structure(structure=structure)
         else:
             result = api.create_structure(
@@ -283,19 +296,18 @@ class TestEmonPy:
     def test_get_extended_structure(
         self,
         api,
+        mock_methods,
         structure,
         get_structure_return,
         raises_error,
         expected_result,
     ):
         """Test the create_structure method."""
-        api.get_structure = MagicMock(
-            return_value=get_structure_return)
+        mock_methods("get_structure")
+        api.get_structure.return_value = get_structure_return
 
         if raises_error is True:
-            with pytest.raises(
-                    ValueError,
-                    match="Fatal Error, inputs was not added to server."):
+            with pytest.raises(ValueError, match=dtest.STRUCTURE_ERROR):
                 api.get_extended_structure(structure=structure)
         else:
             result = api.get_extended_structure(
@@ -1,57 +1,63 @@
 """Tests for the EmonRequest class using async"""
+from hypothesis import given
+from hypothesis import strategies as st
 import pytest
+from emon_tools.emon_api.api_utils import Utils as Ut
 from emon_tools.emonpy.emonpy_core import EmonPyCore
 from emon_tools.emonpy.emonpy_core import EmonFilters
 from emon_tools.emonpy.emonpy_core import EmonFilterItem
 
+SAMPLE_FEEDS = (
+    {"id": 1, "name": "Feed1"},
+    {"id": 2, "name": "Feed2"},
+    {"id": 3, "name": "Feed3"},
+    {"id": 4, "name": "Feed4"},
+)
+
+IS_FILTERS_STRUCTURE_CASES = (
+    (
+        {
+            "filter_inputs": {"nodeid": set(), "name": set()},
+            "filter_feeds": {"tag": set(), "name": set()}
+        },
+        True
+    ),
+    (
+        {
+            "filter_inputs": {"nodeid": 1, "name": "aa"},
+            "filter_feeds": {"tag": set(), "name": set()}
+        },
+        False
+    ),
+    (
+        {
+            "filter_inputs": {"nodeid": set(), "name": set()},
+            "filter_feeds": {"tag": 1, "name": "aa"}
+        },
+        False
+    ),
+    (
+        {
+            "filter_inputs": {"nodeid": set(), "name": set()}
+        },
+        False
+    ),
+    (
+        {
+            "filter_inputs": {"nodeid": set(), "name": set()}
+        },
+        False
+    ),
+)
+
 
 class TestEmonPyCore:
     """Tests EmonPyCore class."""
-    @pytest.mark.parametrize(
-        "filters, expected_result",
-        [
-            (
-                {
-                    "filter_inputs": {"nodeid": set(), "name": set()},
-                    "filter_feeds": {"tag": set(), "name": set()}
-                },
-                True
-            ),
-            (
-                {
-                    "filter_inputs": {"nodeid": 1, "name": "aa"},
-                    "filter_feeds": {"tag": set(), "name": set()}
-                },
-                False
-            ),
-            (
-                {
-                    "filter_inputs": {"nodeid": set(), "name": set()},
-                    "filter_feeds": {"tag": 1, "name": "aa"}
-                },
-                False
-            ),
-            (
-                {
-                    "filter_inputs": {"nodeid": set(), "name": set()}
-                },
-                False
-            ),
-            (
-                {
-                    "filter_inputs": {"nodeid": set(), "name": set()}
-                },
-                False
-            ),
-        ],
-    )
-    def test_is_filters_structure(
-        self,
-        filters,
-        expected_result
-    ):
-        """Test URL validation with an invalid URL."""
-        assert EmonPyCore.is_filters_structure(filters) == expected_result
+    def test_is_filters_structure(self):
+        """Test filters structure validation."""
+        for filters, expected_result in IS_FILTERS_STRUCTURE_CASES:
+            assert EmonPyCore.is_filters_structure(filters)\
+                == expected_result, filters
 
     @pytest.mark.parametrize(
         (
@@ -116,6 +122,13 @@ class TestEmonPyCore:
                 process_id=process_id
             ) == expected_result
 
+    @given(feed_id=st.integers(min_value=1))
+    def test_format_process_with_feed_id_valid(self, feed_id):
+        """Test the format_process_with_feed_id method with valid ids."""
+        assert EmonPyCore.format_process_with_feed_id(
+            feed_id=feed_id
+        ) == ['process__log_to_feed', feed_id]
+
     @pytest.mark.parametrize(
         "process_list, expected_result",
         [
@@ -123,6 +136,10 @@ class TestEmonPyCore:
                 "1:1,2:3",
                 {'process__log_to_feed:1', 'process__scale:3'}
             ),
+            (
+                " 1:1, 2:3 ",
+                {'process__log_to_feed:1', 'process__scale:3'}
+            ),
             (
                 None,
                 set()
@@ -307,6 +324,41 @@ class TestEmonPyCore:
             inputs=inputs,
             feeds=feeds) == expected_result
 
+    @pytest.mark.parametrize(
+        "filter_data",
+        [
+            {"nodeid": "def", "name": "abc"},
+            {"nodeid": "def", "name": ["a1", "c1", "zz"]},
+            {"nodeid": ["def", "z1"], "name": ["abc", "az2"]},
+            {"nodeid": "def", "name": None},
+            {"nodeid": "z1"},
+            {"nodeid": "zz", "name": "abc"},
+            None,
+            {},
+        ],
+    )
+    def test_filter_indexed_list(
+        self,
+        filter_data
+    ):
+        """Test indexed filtering matches filter_list_of_dicts."""
+        inputs = [
+            {"name": "abc", "nodeid": "def"},
+            {"name": "a1", "nodeid": "def"},
+            {"name": "c1", "nodeid": "def"},
+            {"name": "abc", "nodeid": "def", "id": 2},
+            {"name": "az1", "nodeid": "z1"},
+            {"name": "az2", "nodeid": "z1"},
+            {"nodeid": "def"},
+        ]
+        index = EmonPyCore.index_list_of_dicts(inputs, ("nodeid", "name"))
+        assert EmonPyCore.filter_indexed_list(
+            inputs,
+            index=index,
+            keys=("nodeid", "name"),
+            filter_data=filter_data
+        ) == Ut.filter_list_of_dicts(inputs, filter_data=filter_data)
+
     @pytest.mark.parametrize(
         "structure, expected_result",
         [
@@ -360,30 +412,17 @@ class TestEmonPyCore:
         [
             (
                 [[1, 1], [2, 2]],
-                [
-                    {"id": 1, "name": "Feed1"},
-                    {"id": 2, "name": "Feed2"},
-                    {"id": 3, "name": "Feed3"}
-                ],
-                [
-                    {"id": 1, "name": "Feed1"},
-                    {"id": 2, "name": "Feed2"}
-                ]
+                list(SAMPLE_FEEDS[:3]),
+                list(SAMPLE_FEEDS[:2])
             ),
             (
                 [[1, 1], [2, 2]],
-                [
-                    {"id": 3, "name": "Feed3"},
-                    {"id": 4, "name": "Feed4"}
-                ],
+                list(SAMPLE_FEEDS[2:]),
                 []
             ),
             (
                 [],
-                [
-                    {"id": 1, "name": "Feed1"},
-                    {"id": 2, "name": "Feed2"}
-                ],
+                list(SAMPLE_FEEDS[:2]),
                 []
             ),
             (
@@ -393,21 +432,13 @@ class TestEmonPyCore:
             ),
             (
                 None,
-                [
-                    {"id": 1, "name": "Feed1"},
-                    {"id": 2, "name": "Feed2"}
-                ],
+                list(SAMPLE_FEEDS[:2]),
                 []
             ),
             (
                 [[1, 1], [2, "a"]],
-                [
-                    {"id": 1, "name": "Feed1"},
-                    {"id": 2, "name": "Feed2"}
-                ],
-                [
-                    {"id": 1, "name": "Feed1"}
-                ]
+                list(SAMPLE_FEEDS[:2]),
+                list(SAMPLE_FEEDS[:1])
             ),
         ],
     )